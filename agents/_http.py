@@ -0,0 +1,54 @@
+"""Shared HTTP clients for all OpenRouter API calls.
+
+Every agent talks to the same host, so a single process-wide connection
+pool keeps TCP+TLS connections alive across calls instead of paying a
+fresh handshake per request.
+"""
+import asyncio
+import atexit
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(30.0)
+
+
+def _make_client(client_cls):
+    """Build a pooled client, preferring HTTP/2 when 'h2' is installed"""
+    try:
+        # HTTP/2 multiplexes concurrent requests over one TCP connection
+        return client_cls(limits=_LIMITS, timeout=_TIMEOUT, http2=True)
+    except ImportError:
+        return client_cls(limits=_LIMITS, timeout=_TIMEOUT)
+
+
+SHARED_HTTPX = _make_client(httpx.Client)
+SHARED_ASYNC_HTTPX = _make_client(httpx.AsyncClient)
+
+
+async def aclose():
+    """Close the shared pools on shutdown.
+
+    The clients are process-wide (both agents hold references), so
+    teardown lives here rather than on any one agent instance. Callers
+    with a running loop can await this directly; everyone else gets the
+    atexit hook below.
+    """
+    SHARED_HTTPX.close()
+    await SHARED_ASYNC_HTTPX.aclose()
+
+
+def _close_at_exit():
+    """atexit hook closing both pools at interpreter shutdown.
+
+    No loop is running this late, so a short-lived one drives the async
+    close; if even that fails the sockets die with the process anyway.
+    """
+    SHARED_HTTPX.close()
+    try:
+        asyncio.run(SHARED_ASYNC_HTTPX.aclose())
+    except Exception:
+        pass
+
+
+atexit.register(_close_at_exit)
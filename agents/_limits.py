@@ -0,0 +1,113 @@
+"""Shared concurrency limits for all OpenRouter-calling agents.
+
+The categorizer and content generator draw from the same provider quota,
+so they must share one concurrency bound instead of each batching up to
+Config.CONCURRENCY requests independently.
+"""
+import asyncio
+import threading
+import time
+import weakref
+
+from config import Config
+
+# One primitive per event loop: asyncio primitives can't be reused across
+# the fresh loops that successive asyncio.run() calls create
+_semaphores = weakref.WeakKeyDictionary()
+_rate_limiters = weakref.WeakKeyDictionary()
+
+
+def get_semaphore():
+    """Semaphore bounding concurrent OpenRouter requests on this loop"""
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(Config.CONCURRENCY or 8)
+        _semaphores[loop] = sem
+    return sem
+
+
+class _RateLimiter:
+    """Minimal async token bucket: at most `rate` acquisitions per `period` seconds"""
+
+    def __init__(self, rate, period=60.0):
+        self.rate = rate
+        self.period = period
+        self._allowance = float(rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return  # limiting disabled
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._allowance = min(
+                    float(self.rate),
+                    self._allowance + (now - self._last) * (self.rate / self.period)
+                )
+                self._last = now
+                if self._allowance >= 1.0:
+                    self._allowance -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._allowance) * (self.period / self.rate))
+
+
+class _SyncRateLimiter:
+    """Thread-safe counterpart of _RateLimiter for the sync call paths"""
+
+    def __init__(self, rate, period=60.0):
+        self.rate = rate
+        self.period = period
+        self._allowance = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return  # limiting disabled
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._allowance = min(
+                    float(self.rate),
+                    self._allowance + (now - self._last) * (self.rate / self.period)
+                )
+                self._last = now
+                if self._allowance >= 1.0:
+                    self._allowance -= 1.0
+                    return
+                wait = (1.0 - self._allowance) * (self.period / self.rate)
+            time.sleep(wait)
+
+
+_sync_limiter = None
+_sync_limiter_lock = threading.Lock()
+
+
+def get_sync_rate_limiter():
+    """Process-wide token bucket for sync API calls (thread-safe)"""
+    global _sync_limiter
+    if _sync_limiter is None:
+        with _sync_limiter_lock:
+            if _sync_limiter is None:
+                _sync_limiter = _SyncRateLimiter(Config.OPENROUTER_RPM)
+    return _sync_limiter
+
+
+def get_rate_limiter():
+    """Token bucket smoothing OpenRouter request rate on this loop.
+
+    Both agents await this before every API call so the process as a
+    whole stays under Config.OPENROUTER_RPM requests per minute instead
+    of bursting and then stalling on 429 backoff.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _rate_limiters.get(loop)
+    if limiter is None:
+        limiter = _RateLimiter(Config.OPENROUTER_RPM)
+        _rate_limiters[loop] = limiter
+    return limiter
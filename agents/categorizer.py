@@ -1,173 +1,533 @@
-import openai
-import os
-from config import Config
-import re
-import time
-
-class AICategorizer:
-    """GPT-1 Agent: Categorizes job trends using DeepSeek R1"""
-    
-    def __init__(self):
-        if not Config.OPENROUTER_API_KEY:
-            raise ValueError("OPENROUTER_API_KEY is not configured in .env file")
-        
-        self.client = openai.OpenAI(
-            api_key=Config.OPENROUTER_API_KEY,
-            base_url=Config.OPENROUTER_BASE_URL
-        )
-        self.categories = ["Admit Card", "Job Notification", "Result", "Not Relevant"]
-        print(f"✅ Categorizer initialized with model: {Config.AI_MODEL}")
-    
-    def categorize(self, trend_text):
-        """Categorize trend using AI (GPT-1 Agent) with retry logic"""
-        max_retries = 3
-        base_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                prompt = self._build_categorization_prompt(trend_text)
-                
-                response = self.client.chat.completions.create(
-                    model=Config.AI_MODEL,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=50,
-                    temperature=0.1,
-                    extra_headers={
-                        "HTTP-Referer": Config.APP_URL,
-                        "X-Title": Config.APP_NAME
-                    }
-                )
-                
-                category = response.choices[0].message.content.strip()
-                
-                # Clean up DeepSeek's thinking process if present
-                category = self._clean_deepseek_response(category)
-                
-                validated_category = self._validate_category(category)
-                
-                # Success!
-                return validated_category
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # Check if it's a rate limit error (429)
-                if "429" in error_str or "rate" in error_str.lower():
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: 2s, 4s, 8s
-                        wait_time = base_delay * (2 ** attempt)
-                        print(f"   ⏳ Rate limited, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        print(f"   ❌ Rate limit exceeded after {max_retries} attempts")
-                        print(f"   💡 Try again in 30 seconds or use fallback categorization")
-                        # Use fallback categorization based on keywords
-                        return self._fallback_categorize(trend_text)
-                else:
-                    print(f"   ❌ Categorization error: {e}")
-                    return self._fallback_categorize(trend_text)
-        
-        # If all retries failed
-        return self._fallback_categorize(trend_text)
-    
-    def _fallback_categorize(self, trend_text):
-        """Fallback categorization using keyword matching when API fails"""
-        trend_lower = trend_text.lower()
-        
-        # Check for Admit Card keywords
-        admit_keywords = ['admit card', 'hall ticket', 'exam date', 'download link']
-        if any(keyword in trend_lower for keyword in admit_keywords):
-            print(f"   🔄 Fallback: Categorized as 'Admit Card' (keyword match)")
-            return "Admit Card"
-        
-        # Check for Job Notification keywords
-        job_keywords = ['recruitment', 'notification', 'vacancy', 'hiring', 'posts announced', 'apply online']
-        if any(keyword in trend_lower for keyword in job_keywords):
-            print(f"   🔄 Fallback: Categorized as 'Job Notification' (keyword match)")
-            return "Job Notification"
-        
-        # Check for Result keywords
-        result_keywords = ['result', 'merit list', 'selection list', 'scorecard', 'declared']
-        if any(keyword in trend_lower for keyword in result_keywords):
-            print(f"   🔄 Fallback: Categorized as 'Result' (keyword match)")
-            return "Result"
-        
-        # Check if it contains job-related organizations
-        job_orgs = ['sbi', 'upsc', 'ssc', 'rrb', 'ibps', 'lic', 'aiims', 'isro', 'drdo', 
-                    'army', 'navy', 'air force', 'police', 'railway', 'bank']
-        
-        has_job_org = any(org in trend_lower for org in job_orgs)
-        
-        if has_job_org:
-            # If it has job org but no specific category, default to Job Notification
-            print(f"   🔄 Fallback: Categorized as 'Job Notification' (organization match)")
-            return "Job Notification"
-        
-        # Otherwise, not relevant
-        print(f"   🔄 Fallback: Categorized as 'Not Relevant' (no job keywords)")
-        return "Not Relevant"
-    
-    def _build_categorization_prompt(self, trend_text):
-        """Build the categorization prompt - Optimized for DeepSeek R1"""
-        return f"""You are a job trend categorizer. Categorize this trend into EXACTLY ONE category.
-
-Categories:
-- Admit Card: Hall tickets, exam dates, admit card downloads
-- Job Notification: Job vacancies, recruitment, hiring announcements  
-- Result: Exam results, merit lists, selection lists
-- Not Relevant: Anything else
-
-Trend: "{trend_text}"
-
-Return ONLY the category name, nothing else."""
-    
-    def _clean_deepseek_response(self, response):
-        """Clean DeepSeek R1's thinking process from response"""
-        # DeepSeek R1 sometimes includes <think>...</think> tags
-        response = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
-        response = response.strip()
-        
-        # Extract just the category if there's extra text
-        for category in self.categories:
-            if category.lower() in response.lower():
-                return category
-        
-        return response
-    
-    def _validate_category(self, category):
-        """Validate and clean the category"""
-        category = category.strip()
-        
-        # Direct match
-        if category in self.categories:
-            return category
-        
-        # Fuzzy match
-        category_lower = category.lower()
-        if "admit" in category_lower or "hall ticket" in category_lower:
-            return "Admit Card"
-        elif "job" in category_lower or "notification" in category_lower or "vacancy" in category_lower or "recruitment" in category_lower:
-            return "Job Notification"
-        elif "result" in category_lower or "merit" in category_lower:
-            return "Result"
-        else:
-            return "Not Relevant"
-    
-    def batch_categorize(self, trends_list):
-        """Categorize multiple trends at once with delays"""
-        results = []
-        for idx, trend in enumerate(trends_list):
-            category = self.categorize(trend)
-            results.append({
-                'trend': trend,
-                'category': category
-            })
-            
-            # Add delay between batches to avoid rate limits
-            if idx < len(trends_list) - 1:
-                time.sleep(1.5)  # 1.5 second delay between items
-        
-        return results
\ No newline at end of file
+import logging
+import os
+from config import Config
+from agents._limits import get_semaphore, get_rate_limiter, get_sync_rate_limiter
+import re
+import time
+import asyncio
+import hashlib
+import json
+import random
+
+log = logging.getLogger(__name__)
+
+# Max trends packed into a single batched categorization request
+_BATCH_PROMPT_SIZE = 20
+
+# Static instruction block kept byte-identical across calls (and placed
+# before the varying trend) so providers can serve it from prefix cache
+_STATIC_INSTRUCTIONS = """You are a job trend categorizer. Categorize the trend into EXACTLY ONE category.
+
+Categories:
+- Admit Card: Hall tickets, exam dates, admit card downloads
+- Job Notification: Job vacancies, recruitment, hiring announcements
+- Result: Exam results, merit lists, selection lists
+- Not Relevant: Anything else
+
+Return ONLY the category name, nothing else."""
+
+# Compiled once at import - DeepSeek R1 thinking tags and whitespace runs
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
+def _retry_wait(error, attempt, base_delay):
+    """Compute how long to wait before retrying a failed API call.
+
+    Honors the server's Retry-After header when present; otherwise uses
+    exponential backoff with random jitter so parallel workers don't
+    synchronize their retries and re-stampede the rate limiter.
+    """
+    response = getattr(error, 'response', None)
+    if response is not None:
+        retry_after = getattr(response, 'headers', {}).get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except (TypeError, ValueError):
+                pass
+
+    wait = base_delay * (2 ** attempt)
+    return wait + random.uniform(0, wait)
+
+# Disk cache is optional - without it the cache is in-memory only
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+def _normalize(trend_text):
+    """Normalize a trend string for cache keying"""
+    return _WS_RE.sub(' ', trend_text.strip().lower())
+
+def _cache_key(trend_text):
+    """Stable cache key from the normalized trend.
+
+    The model id and temperature are folded into the key so changing
+    either Config value busts stale entries instead of serving answers
+    produced under different settings.
+    """
+    return hashlib.sha1(
+        f"{Config.AI_MODEL}|{Config.TEMPERATURE}|{_normalize(trend_text)}".encode('utf-8')
+    ).hexdigest()
+
+# Keyword tables for deterministic categorization (built once at import)
+_ADMIT_KEYWORDS = frozenset(['admit card', 'hall ticket', 'exam date', 'download link'])
+_JOB_KEYWORDS = frozenset(['recruitment', 'notification', 'vacancy', 'hiring', 'posts announced', 'apply online'])
+_RESULT_KEYWORDS = frozenset(['result', 'merit list', 'selection list', 'scorecard', 'declared'])
+_JOB_ORGS = frozenset(['sbi', 'upsc', 'ssc', 'rrb', 'ibps', 'lic', 'aiims', 'isro', 'drdo',
+                       'army', 'navy', 'air force', 'police', 'railway', 'bank'])
+
+_CATEGORY_KEYWORDS = (
+    ("Admit Card", _ADMIT_KEYWORDS),
+    ("Job Notification", _JOB_KEYWORDS),
+    ("Result", _RESULT_KEYWORDS),
+)
+
+# Canonical category set plus ordered (keyword, category) pairs for the
+# fuzzy validation pass - one loop instead of chained elif branches
+_CATEGORIES = frozenset(["Admit Card", "Job Notification", "Result", "Not Relevant"])
+_FUZZY = (
+    ("admit", "Admit Card"),
+    ("hall ticket", "Admit Card"),
+    ("job", "Job Notification"),
+    ("notification", "Job Notification"),
+    ("vacancy", "Job Notification"),
+    ("recruitment", "Job Notification"),
+    ("result", "Result"),
+    ("merit", "Result"),
+)
+
+# First response token -> category, so well-formed model output resolves
+# in a single dict lookup without the fuzzy-match branches
+_FIRST_TOKEN_CATEGORY = {
+    'admit': 'Admit Card',
+    'job': 'Job Notification',
+    'result': 'Result',
+    'not': 'Not Relevant',
+}
+
+# Single keywords strong enough to decide the category without the LLM
+_STRONG_SIGNALS = {
+    'admit card': 'Admit Card',
+    'hall ticket': 'Admit Card',
+    'merit list': 'Result',
+    'selection list': 'Result',
+}
+
+# Keyword -> category map plus one alternation regex, so the regex-based
+# fallback collects every keyword hit in a single C-level scan
+_KW_TO_CAT = {keyword: category for category, keywords in _CATEGORY_KEYWORDS for keyword in keywords}
+_ALL_KW_RE = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(_KW_TO_CAT, key=len, reverse=True)
+))
+_ORG_RE = re.compile('|'.join(re.escape(org) for org in sorted(_JOB_ORGS, key=len, reverse=True)))
+
+# Optional Aho-Corasick automaton: finds every keyword in one linear pass
+# over the trend instead of one substring scan per keyword
+try:
+    import ahocorasick
+    _AC = ahocorasick.Automaton()
+    for _category, _keywords in _CATEGORY_KEYWORDS:
+        for _keyword in _keywords:
+            _AC.add_word(_keyword, (_category, _keyword))
+    for _org in _JOB_ORGS:
+        _AC.add_word(_org, ('_org', _org))
+    _AC.make_automaton()
+except ImportError:
+    _AC = None
+
+class AICategorizer:
+    """GPT-1 Agent: Categorizes job trends using DeepSeek R1"""
+
+    def __init__(self):
+        if not Config.OPENROUTER_API_KEY:
+            raise ValueError("OPENROUTER_API_KEY is not configured in .env file")
+
+        # Imported lazily: openai transitively pulls in httpx/pydantic,
+        # a cost processes that never categorize shouldn't pay at import
+        import openai
+        from agents._http import SHARED_HTTPX, SHARED_ASYNC_HTTPX
+
+        self.client = openai.OpenAI(
+            api_key=Config.OPENROUTER_API_KEY,
+            base_url=Config.OPENROUTER_BASE_URL,
+            http_client=SHARED_HTTPX
+        )
+        self.aclient = openai.AsyncOpenAI(
+            api_key=Config.OPENROUTER_API_KEY,
+            base_url=Config.OPENROUTER_BASE_URL,
+            http_client=SHARED_ASYNC_HTTPX
+        )
+        self.categories = ["Admit Card", "Job Notification", "Result", "Not Relevant"]
+
+        # Two-tier cache: small in-memory dict for hot repeats + optional
+        # disk cache so results survive across runs
+        self._memory_cache = {}
+        self._disk_cache = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._disk_cache = diskcache.Cache(os.path.join(Config.CACHE_DIR, 'categorizer'))
+            except Exception as e:
+                log.warning(f"⚠️ Could not open categorizer disk cache: {e}")
+
+        log.info(f"✅ Categorizer initialized with model: {Config.AI_MODEL}")
+
+    def _cache_get(self, trend_text):
+        """Look up a previous categorization (memory first, then disk)"""
+        key = _cache_key(trend_text)
+        category = self._memory_cache.get(key)
+        if category is None and self._disk_cache is not None:
+            category = self._disk_cache.get(key)
+            if category is not None:
+                self._memory_cache[key] = category
+        if category is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+        return category
+
+    def _cache_put(self, trend_text, category):
+        """Store a successful categorization in both cache tiers"""
+        key = _cache_key(trend_text)
+        self._memory_cache[key] = category
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache[key] = category
+            except Exception:
+                pass
+    
+    def cache_stats(self):
+        """Hit/miss counters and tier sizes for the /cache-stats route"""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'memory_entries': len(self._memory_cache),
+            'disk_enabled': self._disk_cache is not None
+        }
+
+    def _keyword_score(self, trend_lower):
+        """Count keyword hits per category for the fast path"""
+        return {
+            category: sum(1 for keyword in keywords if keyword in trend_lower)
+            for category, keywords in _CATEGORY_KEYWORDS
+        }
+
+    def _keyword_categorize(self, trend_text):
+        """Deterministic keyword fast path - returns None when ambiguous"""
+        trend_lower = trend_text.lower()
+
+        # Strong single signals decide immediately
+        for signal, category in _STRONG_SIGNALS.items():
+            if signal in trend_lower:
+                return category
+
+        # Unambiguous if exactly one category has keyword hits
+        scores = self._keyword_score(trend_lower)
+        matched = [category for category, score in scores.items() if score > 0]
+        if len(matched) == 1:
+            return matched[0]
+
+        return None
+
+    def categorize(self, trend_text):
+        """Categorize trend using AI (GPT-1 Agent) with retry logic"""
+        # Fast path: skip the LLM entirely when keywords are unambiguous
+        if Config.LLM_FALLBACK_ONLY_AMBIGUOUS:
+            keyword_category = self._keyword_categorize(trend_text)
+            if keyword_category is not None:
+                return keyword_category
+
+        # Cache hit: identical (normalized) trend already classified
+        cached = self._cache_get(trend_text)
+        if cached is not None:
+            return cached
+
+        max_retries = 3
+        base_delay = 2  # seconds
+
+        for attempt in range(max_retries):
+            try:
+                get_sync_rate_limiter().acquire()
+                response = self.client.chat.completions.create(
+                    model=Config.AI_MODEL,
+                    messages=self._build_messages(trend_text),
+                    max_tokens=8,
+                    stop=["\n"],
+                    temperature=0.1,
+                    extra_headers={
+                        "HTTP-Referer": Config.APP_URL,
+                        "X-Title": Config.APP_NAME
+                    }
+                )
+                
+                category = response.choices[0].message.content.strip()
+                
+                # Clean up DeepSeek's thinking process if present
+                category = self._clean_deepseek_response(category)
+                
+                validated_category = self._validate_category(category)
+
+                # Success!
+                self._cache_put(trend_text, validated_category)
+                return validated_category
+                
+            except Exception as e:
+                error_str = str(e)
+                
+                # Check if it's a rate limit error (429)
+                if "429" in error_str or "rate" in error_str.lower():
+                    if attempt < max_retries - 1:
+                        # Jittered exponential backoff, honoring Retry-After
+                        wait_time = _retry_wait(e, attempt, base_delay)
+                        log.warning(f"   ⏳ Rate limited, waiting {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        log.error(f"   ❌ Rate limit exceeded after {max_retries} attempts")
+                        log.warning(f"   💡 Try again in 30 seconds or use fallback categorization")
+                        # Use fallback categorization based on keywords
+                        return self._fallback_categorize(trend_text)
+                else:
+                    log.error(f"   ❌ Categorization error: {e}")
+                    return self._fallback_categorize(trend_text)
+        
+        # If all retries failed
+        return self._fallback_categorize(trend_text)
+    
+    def _fallback_categorize(self, trend_text):
+        """Fallback categorization using keyword matching when API fails"""
+        trend_lower = trend_text.lower()
+
+        # Single-pass automaton scan when pyahocorasick is available
+        if _AC is not None:
+            hits = {category for _, (category, _keyword) in _AC.iter(trend_lower)}
+            for category in ("Admit Card", "Job Notification", "Result"):
+                if category in hits:
+                    log.info(f"   🔄 Fallback: Categorized as '{category}' (keyword match)")
+                    return category
+            if '_org' in hits:
+                log.info(f"   🔄 Fallback: Categorized as 'Job Notification' (organization match)")
+                return "Job Notification"
+            log.info(f"   🔄 Fallback: Categorized as 'Not Relevant' (no job keywords)")
+            return "Not Relevant"
+
+        # Regex path when the C extension is missing: one alternation
+        # scan collects all keyword hits instead of four separate sweeps
+        hits = {_KW_TO_CAT[match.group(0)] for match in _ALL_KW_RE.finditer(trend_lower)}
+        for category in ("Admit Card", "Job Notification", "Result"):
+            if category in hits:
+                log.info(f"   🔄 Fallback: Categorized as '{category}' (keyword match)")
+                return category
+
+        # Job org but no specific category defaults to Job Notification
+        if _ORG_RE.search(trend_lower):
+            log.info(f"   🔄 Fallback: Categorized as 'Job Notification' (organization match)")
+            return "Job Notification"
+
+        # Otherwise, not relevant
+        log.info(f"   🔄 Fallback: Categorized as 'Not Relevant' (no job keywords)")
+        return "Not Relevant"
+    
+    def _build_messages(self, trend_text):
+        """Static instructions as system message, varying trend at the end"""
+        return [
+            {"role": "system", "content": _STATIC_INSTRUCTIONS},
+            {"role": "user", "content": f'Trend: "{trend_text}"'}
+        ]
+    
+    def _clean_deepseek_response(self, response):
+        """Clean DeepSeek R1's thinking process from response"""
+        # DeepSeek R1 sometimes includes <think>...</think> tags
+        response = _THINK_RE.sub('', response).strip()
+        
+        # Extract just the category if there's extra text
+        for category in self.categories:
+            if category.lower() in response.lower():
+                return category
+        
+        return response
+    
+    def _validate_category(self, category):
+        """Validate and clean the category"""
+        category = category.strip()
+        
+        # Direct match
+        if category in _CATEGORIES:
+            return category
+
+        # First-token dispatch: one dict lookup for well-formed responses
+        if category:
+            first_token = category.split(None, 1)[0].strip('"\':,.').lower()
+            mapped = _FIRST_TOKEN_CATEGORY.get(first_token)
+            if mapped:
+                return mapped
+
+        # Fuzzy match (malformed responses only), in priority order
+        category_lower = category.lower()
+        for keyword, canonical in _FUZZY:
+            if keyword in category_lower:
+                return canonical
+        return "Not Relevant"
+    
+    async def _acategorize(self, trend_text, sem):
+        """Async version of categorize - one concurrent request bounded by the semaphore"""
+        # Same keyword fast path and cache as the sync version
+        if Config.LLM_FALLBACK_ONLY_AMBIGUOUS:
+            keyword_category = self._keyword_categorize(trend_text)
+            if keyword_category is not None:
+                return keyword_category
+
+        cached = self._cache_get(trend_text)
+        if cached is not None:
+            return cached
+
+        max_retries = 3
+        base_delay = 2  # seconds
+
+        async with sem:
+            for attempt in range(max_retries):
+                try:
+                    await get_rate_limiter().acquire()
+                    response = await self.aclient.chat.completions.create(
+                        model=Config.AI_MODEL,
+                        messages=self._build_messages(trend_text),
+                        max_tokens=8,
+                        stop=["\n"],
+                        temperature=0.1,
+                        extra_headers={
+                            "HTTP-Referer": Config.APP_URL,
+                            "X-Title": Config.APP_NAME
+                        }
+                    )
+
+                    category = response.choices[0].message.content.strip()
+                    category = self._clean_deepseek_response(category)
+                    validated_category = self._validate_category(category)
+                    self._cache_put(trend_text, validated_category)
+                    return validated_category
+
+                except Exception as e:
+                    error_str = str(e)
+
+                    if "429" in error_str or "rate" in error_str.lower():
+                        if attempt < max_retries - 1:
+                            wait_time = _retry_wait(e, attempt, base_delay)
+                            log.warning(f"   ⏳ Rate limited, waiting {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                            await asyncio.sleep(wait_time)
+                            continue
+                        else:
+                            log.error(f"   ❌ Rate limit exceeded after {max_retries} attempts")
+                            return self._fallback_categorize(trend_text)
+                    else:
+                        log.error(f"   ❌ Categorization error: {e}")
+                        return self._fallback_categorize(trend_text)
+
+        return self._fallback_categorize(trend_text)
+
+    async def abatch_categorize(self, trends_list):
+        """Categorize multiple trends concurrently (bounded by Config.CONCURRENCY)"""
+        sem = get_semaphore()
+        categories = await asyncio.gather(
+            *[self._acategorize(trend, sem) for trend in trends_list]
+        )
+        return [
+            {'trend': trend, 'category': category}
+            for trend, category in zip(trends_list, categories)
+        ]
+
+    def batch_categorize(self, trends_list):
+        """Categorize multiple trends at once (sync wrapper around abatch_categorize)"""
+        return asyncio.run(self.abatch_categorize(trends_list))
+
+    def categorize_many(self, trends_list):
+        """Categorize a list of trends with one LLM request per batch.
+
+        Packing up to 20 trends into a single prompt amortizes the fixed
+        per-request overhead (network RTT + prompt prefix) that dominates
+        short classifications. Falls back to per-item categorization when
+        the model returns malformed JSON.
+        """
+        categories = []
+        for start in range(0, len(trends_list), _BATCH_PROMPT_SIZE):
+            categories.extend(self._categorize_chunk(trends_list[start:start + _BATCH_PROMPT_SIZE]))
+        return categories
+
+    def _categorize_chunk(self, chunk):
+        """Categorize one chunk of trends, resolving cheap cases locally first"""
+        categories = [None] * len(chunk)
+        pending = []
+
+        for idx, trend in enumerate(chunk):
+            if Config.LLM_FALLBACK_ONLY_AMBIGUOUS:
+                category = self._keyword_categorize(trend)
+                if category is not None:
+                    categories[idx] = category
+                    continue
+            cached = self._cache_get(trend)
+            if cached is not None:
+                categories[idx] = cached
+            else:
+                pending.append(idx)
+
+        if not pending:
+            return categories
+
+        prompt = self._build_batch_prompt([chunk[i] for i in pending])
+        try:
+            get_sync_rate_limiter().acquire()
+            response = self.client.chat.completions.create(
+                model=Config.AI_MODEL,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=12 * len(pending) + 20,
+                temperature=0.1,
+                extra_headers={
+                    "HTTP-Referer": Config.APP_URL,
+                    "X-Title": Config.APP_NAME
+                }
+            )
+            labels = self._parse_batch_response(
+                response.choices[0].message.content, len(pending)
+            )
+            for idx, label in zip(pending, labels):
+                category = self._validate_category(label)
+                self._cache_put(chunk[idx], category)
+                categories[idx] = category
+            return categories
+        except Exception as e:
+            log.warning(f"   ⚠️ Batch categorization failed ({e}), falling back to per-item")
+            for idx in pending:
+                categories[idx] = self.categorize(chunk[idx])
+            return categories
+
+    def _build_batch_prompt(self, trends):
+        """Build a single prompt asking for a JSON array of category labels"""
+        numbered = "\n".join(f'{i + 1}) "{trend}"' for i, trend in enumerate(trends))
+        return f"""You are a job trend categorizer. Categorize EACH of the following {len(trends)} trends into EXACTLY ONE category.
+
+Categories:
+- Admit Card: Hall tickets, exam dates, admit card downloads
+- Job Notification: Job vacancies, recruitment, hiring announcements
+- Result: Exam results, merit lists, selection lists
+- Not Relevant: Anything else
+
+Trends:
+{numbered}
+
+Return ONLY a JSON array of {len(trends)} category names, in order, nothing else."""
+
+    def _parse_batch_response(self, response, expected):
+        """Extract the JSON array of labels from a batch response"""
+        response = _THINK_RE.sub('', response).strip()
+        start = response.find('[')
+        end = response.rfind(']')
+        if start == -1 or end == -1:
+            raise ValueError("no JSON array in batch response")
+        labels = json.loads(response[start:end + 1])
+        if not isinstance(labels, list) or len(labels) != expected:
+            raise ValueError(f"expected {expected} labels, got {labels!r}")
+        return labels
\ No newline at end of file
@@ -1,268 +1,678 @@
-from openai import OpenAI
-import os
-from config import Config
-import re
-import time
-
-class ContentGenerator:
-    """GPT-2 Agent: Generates social media content using DeepSeek R1"""
-    
-    def __init__(self):
-        if not Config.OPENROUTER_API_KEY:
-            raise ValueError("OPENROUTER_API_KEY is not configured")
-        
-        self.client = OpenAI(
-            api_key=Config.OPENROUTER_API_KEY,
-            base_url=Config.OPENROUTER_BASE_URL
-        )
-        print(f"✅ Content Generator initialized with model: {Config.AI_MODEL}")
-    
-    def generate_content(self, trend, category):
-        """Generate social media content using AI (GPT-2 Agent) with retry logic"""
-        if not trend or category == "Not Relevant":
-            return self.get_fallback_content(trend, category)
-        
-        max_retries = 3
-        base_delay = 2
-        
-        for attempt in range(max_retries):
-            try:
-                prompt = self._build_content_prompt(trend, category)
-                
-                response = self.client.chat.completions.create(
-                    model=Config.AI_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a social media content creator for JobYaari, specializing in Indian government job updates. Create engaging, actionable content."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=Config.MAX_TOKENS,
-                    temperature=Config.TEMPERATURE,
-                    extra_headers={
-                        "HTTP-Referer": Config.APP_URL,
-                        "X-Title": Config.APP_NAME
-                    }
-                )
-                
-                content_text = response.choices[0].message.content
-                
-                # Clean DeepSeek's thinking process
-                content_text = self._clean_deepseek_response(content_text)
-                
-                parsed_content = self.parse_content(content_text)
-                
-                # Validate parsed content
-                if not any(parsed_content.values()):
-                    print(f"   ⚠️ Empty content generated, using fallback")
-                    return self.get_fallback_content(trend, category)
-                
-                return parsed_content
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # Check if it's a rate limit error
-                if "429" in error_str or "rate" in error_str.lower():
-                    if attempt < max_retries - 1:
-                        wait_time = base_delay * (2 ** attempt)
-                        print(f"   ⏳ Rate limited, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        print(f"   ❌ Rate limit exceeded, using fallback content")
-                        return self.get_fallback_content(trend, category)
-                else:
-                    print(f"   ❌ Content generation error: {e}")
-                    return self.get_fallback_content(trend, category)
-        
-        return self.get_fallback_content(trend, category)
-    
-    def _clean_deepseek_response(self, response):
-        """Remove DeepSeek R1's thinking tags"""
-        response = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
-        return response.strip()
-    
-    def _build_content_prompt(self, trend, category):
-        """Build the content generation prompt - Optimized for DeepSeek R1"""
-        # Add links based on category
-        link_placeholder = self._get_link_placeholder(category)
-        
-        return f"""Create social media content for this Indian government job update.
-
-TREND: {trend}
-CATEGORY: {category}
-
-Generate content with these sections (use EXACT labels):
-
-INSTAGRAM_POST:
-Write 2-3 lines with emojis and 3-5 hashtags. Make it urgent and engaging for 18-30 year olds.
-
-BLOG_DRAFT:
-Write 120-150 words with:
-- Opening hook
-- Key details (dates, eligibility, {link_placeholder})
-- Benefits
-- Call-to-action
-Use short paragraphs.
-
-YOUTUBE_SCRIPT:
-30-second script:
-- Hook (5 sec)
-- Main content (20 sec)  
-- Call-to-action (5 sec)
-Include visual cues in [brackets]
-
-THUMBNAIL_IDEA:
-Describe eye-catching thumbnail:
-- Main text (what to write)
-- Background color
-- Visual elements
-- Text placement
-
-Use Hindi-English mix where appropriate. Keep all content shareable and actionable."""
-    
-    def _get_link_placeholder(self, category):
-        """Get appropriate link placeholder based on category"""
-        if category == "Admit Card":
-            return "admit card download link"
-        elif category == "Job Notification":
-            return "application link"
-        elif category == "Result":
-            return "result link"
-        return "official link"
-    
-    def parse_content(self, content_text):
-        """Parse the structured AI response"""
-        content = {
-            'instagram': '',
-            'blog': '', 
-            'youtube': '',
-            'thumbnail': ''
-        }
-        
-        sections = {
-            'INSTAGRAM_POST:': 'instagram',
-            'BLOG_DRAFT:': 'blog',
-            'YOUTUBE_SCRIPT:': 'youtube',
-            'THUMBNAIL_IDEA:': 'thumbnail'
-        }
-        
-        current_section = None
-        lines = content_text.split('\n')
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Check if line starts a new section
-            section_found = False
-            for section_header, section_key in sections.items():
-                if line_stripped.upper().startswith(section_header.upper()):
-                    current_section = section_key
-                    # Get content after the header
-                    content_after_header = line_stripped[len(section_header):].strip()
-                    if content_after_header:
-                        content[current_section] = content_after_header
-                    section_found = True
-                    break
-            
-            # If not a section header and we're in a section, add to current section
-            if not section_found and current_section and line_stripped:
-                # Skip separator lines
-                if line_stripped.startswith('---') or line_stripped.startswith('===') or line_stripped.startswith('***'):
-                    continue
-                # Append to current section
-                if content[current_section]:
-                    content[current_section] += ' ' + line_stripped
-                else:
-                    content[current_section] = line_stripped
-        
-        # Clean up each section
-        for key in content:
-            content[key] = content[key].strip()
-            # Remove any remaining section markers
-            for header in sections.keys():
-                content[key] = content[key].replace(header, '').strip()
-        
-        return content
-    
-    def get_fallback_content(self, trend, category):
-        """Fallback content if AI fails"""
-        hashtags_map = {
-            "Admit Card": "#AdmitCard #HallTicket #ExamUpdate #JobYaari #SarkariExam",
-            "Job Notification": "#JobAlert #GovernmentJobs #Vacancy #Recruitment #JobYaari",
-            "Result": "#Result #MeritList #ExamResult #JobYaari #SarkariResult"
-        }
-        
-        link_map = {
-            "Admit Card": "Download Admit Card: [Official Link]",
-            "Job Notification": "Apply Online: [Official Link]",
-            "Result": "Check Result: [Official Link]"
-        }
-        
-        hashtags = hashtags_map.get(category, "#GovernmentJobs #JobUpdate #JobYaari")
-        link_text = link_map.get(category, "Visit: [Official Link]")
-        
-        return {
-            'instagram': f"🎯 {trend}\n\nImportant update for government job aspirants! 📝\n{link_text}\n\n{hashtags} 🔥",
-            
-            'blog': f"""📢 Latest Update: {trend}
-
-This is an important development for job seekers across India. {category} notifications are crucial for candidates preparing for government sector careers.
-
-🔑 Key Points:
-• Important update for aspirants
-• Check official notification for eligibility criteria
-• {link_text}
-• Don't miss important deadlines
-
-Stay updated with JobYaari for more government job notifications and exam updates! 🚀
-
-{link_text}""",
-            
-            'youtube': f"""[OPENING - 0:00-0:05]
-🔔 Big breaking news for government job seekers!
-
-[MAIN CONTENT - 0:05-0:25]
-{trend}
-
-📋 Important Details:
-- Check eligibility criteria
-- {link_text}
-- Note all important dates
-
-[CALL TO ACTION - 0:25-0:30]
-👍 Like, Share & Subscribe for daily job updates!
-Visit JobYaari.com for complete details!""",
-            
-            'thumbnail': f"""🎨 THUMBNAIL DESIGN:
-
-Background: Bold YELLOW with RED accent border
-
-Main Text (White, Bold, 72pt): "{category.upper()}"
-Subtitle (Black, 48pt): {trend[:30]}...
-
-Visual Elements:
-- Government building silhouette (bottom)
-- Red "NEW" badge (top-right corner)
-- Urgency indicator: Clock icon
-- Professional, clean design for Indian audience
-
-Layout: Center-aligned with strong contrast"""
-        }
-    
-    def validate_content(self, content):
-        """Validate generated content quality"""
-        issues = []
-        
-        if not content['instagram'] or len(content['instagram']) < 20:
-            issues.append("Instagram post too short")
-        
-        if not content['blog'] or len(content['blog']) < 50:
-            issues.append("Blog draft too short")
-        
-        if not content['youtube'] or len(content['youtube']) < 30:
-            issues.append("YouTube script too short")
-        
-        if not content['thumbnail']:
-            issues.append("Thumbnail idea missing")
-        
+import logging
+import os
+from config import Config
+from agents._limits import get_semaphore, get_rate_limiter, get_sync_rate_limiter
+import re
+import time
+import asyncio
+
+log = logging.getLogger(__name__)
+
+# DeepSeek R1 thinking tags, compiled once at import
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
+# Disk cache is optional - without it the content cache is in-memory only
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Generated content goes stale quickly (admit-card dates, deadlines), so
+# cache entries only live for an hour
+_CONTENT_CACHE_TTL = 3600
+
+# After exhausting retries on a 429, skip the API entirely for this long
+# so the rest of the batch doesn't serially repeat the backoff penalty
+_BREAKER_COOLDOWN = 60
+
+def _content_key(trend, category):
+    """Cache key from the normalized trend + category.
+
+    Tagged with the model id and temperature so changing either Config
+    value busts the cache instead of serving stale generations.
+    """
+    return f"{Config.AI_MODEL}|{Config.TEMPERATURE}|{_WS_RE.sub(' ', trend.strip().lower())}|{category}"
+
+# Section splitting in a single pass: re.split on the headers segments
+# the whole blob at C speed, alternating captured headers and bodies
+_SECTION_RE = re.compile(
+    r'(?im)^\s*(INSTAGRAM_POST|BLOG_DRAFT|YOUTUBE_SCRIPT|THUMBNAIL_IDEA)\s*:\s*'
+)
+
+# Separator-line prefixes skipped by both parsers
+_SEP_PREFIXES = frozenset(('---', '===', '***'))
+
+_LABEL_MAP = {
+    'INSTAGRAM_POST': 'instagram',
+    'BLOG_DRAFT': 'blog',
+    'YOUTUBE_SCRIPT': 'youtube',
+    'THUMBNAIL_IDEA': 'thumbnail'
+}
+
+
+def _clean_section(body):
+    """Apply the same cleanups to a section body as the fallback parser:
+    drop separator lines and strip any stray section markers, so both
+    parse paths produce consistent output"""
+    body = '\n'.join(
+        line for line in body.split('\n')
+        if line.strip()[:3] not in _SEP_PREFIXES
+    )
+    for header in _LABEL_MAP:
+        body = body.replace(header + ':', '')
+    return body.strip()
+
+# Header-line matcher for the fallback parser: one C-level match yields
+# both the section key and any content trailing the colon
+_HDR_LINE_RE = re.compile(
+    r'^(INSTAGRAM_POST|BLOG_DRAFT|YOUTUBE_SCRIPT|THUMBNAIL_IDEA)\s*:\s*(.*)$',
+    re.IGNORECASE
+)
+
+# Static prompt scaffold, identical across all requests. Combined with
+# the category-specific tail into SYSTEM_PROMPTS below; only the TREND
+# line varies per call
+_SYSTEM_MESSAGE = "You are a social media content creator for JobYaari, specializing in Indian government job updates. Create engaging, actionable content."
+
+_PROMPT_PREFIX = """Create social media content for an Indian government job update.
+
+Generate content with these sections (use EXACT labels):
+
+INSTAGRAM_POST:
+Write 2-3 lines with emojis and 3-5 hashtags. Make it urgent and engaging for 18-30 year olds.
+
+BLOG_DRAFT:
+Write 120-150 words with:
+- Opening hook
+- Key details (dates, eligibility, the LINK_TYPE link)
+- Benefits
+- Call-to-action
+Use short paragraphs.
+
+YOUTUBE_SCRIPT:
+30-second script:
+- Hook (5 sec)
+- Main content (20 sec)
+- Call-to-action (5 sec)
+Include visual cues in [brackets]
+
+THUMBNAIL_IDEA:
+Describe eye-catching thumbnail:
+- Main text (what to write)
+- Background color
+- Visual elements
+- Text placement
+
+Use Hindi-English mix where appropriate. Keep all content shareable and actionable."""
+
+# Fallback building blocks, built once at import instead of per call
+_LINK_PLACEHOLDER = {
+    "Admit Card": "admit card download link",
+    "Job Notification": "application link",
+    "Result": "result link"
+}
+
+# Per-category system prompts, precomputed at import. The entire
+# instruction scaffold - including CATEGORY and LINK_TYPE - lives in the
+# system message, byte-for-byte identical for every trend in a category,
+# so the provider's prompt cache covers everything except the short
+# "TREND: ..." user turn
+SYSTEM_PROMPTS = {
+    category: (
+        _SYSTEM_MESSAGE
+        + "\n\n" + _PROMPT_PREFIX
+        + f"\n\nCATEGORY: {category}"
+        + f"\nLINK_TYPE: {placeholder}"
+    )
+    for category, placeholder in _LINK_PLACEHOLDER.items()
+}
+
+_HASHTAGS_MAP = {
+    "Admit Card": "#AdmitCard #HallTicket #ExamUpdate #JobYaari #SarkariExam",
+    "Job Notification": "#JobAlert #GovernmentJobs #Vacancy #Recruitment #JobYaari",
+    "Result": "#Result #MeritList #ExamResult #JobYaari #SarkariResult"
+}
+
+_LINK_MAP = {
+    "Admit Card": "Download Admit Card: [Official Link]",
+    "Job Notification": "Apply Online: [Official Link]",
+    "Result": "Check Result: [Official Link]"
+}
+
+_INSTAGRAM_TMPL = "🎯 {trend}\n\nImportant update for government job aspirants! 📝\n{link_text}\n\n{hashtags} 🔥"
+
+_BLOG_TMPL = """📢 Latest Update: {trend}
+
+This is an important development for job seekers across India. {category} notifications are crucial for candidates preparing for government sector careers.
+
+🔑 Key Points:
+• Important update for aspirants
+• Check official notification for eligibility criteria
+• {link_text}
+• Don't miss important deadlines
+
+Stay updated with JobYaari for more government job notifications and exam updates! 🚀
+
+{link_text}"""
+
+_YOUTUBE_TMPL = """[OPENING - 0:00-0:05]
+🔔 Big breaking news for government job seekers!
+
+[MAIN CONTENT - 0:05-0:25]
+{trend}
+
+📋 Important Details:
+- Check eligibility criteria
+- {link_text}
+- Note all important dates
+
+[CALL TO ACTION - 0:25-0:30]
+👍 Like, Share & Subscribe for daily job updates!
+Visit JobYaari.com for complete details!"""
+
+_THUMBNAIL_TMPL = """🎨 THUMBNAIL DESIGN:
+
+Background: Bold YELLOW with RED accent border
+
+Main Text (White, Bold, 72pt): "{category_upper}"
+Subtitle (Black, 48pt): {trend_short}...
+
+Visual Elements:
+- Government building silhouette (bottom)
+- Red "NEW" badge (top-right corner)
+- Urgency indicator: Clock icon
+- Professional, clean design for Indian audience
+
+Layout: Center-aligned with strong contrast"""
+
+class ContentGenerator:
+    """GPT-2 Agent: Generates social media content using DeepSeek R1"""
+
+    # Fixed attribute set - slots drop the per-instance __dict__
+    __slots__ = ('_client', '_aclient', '_memory_cache', '_disk_cache',
+                 '_cache_hits', '_cache_misses')
+
+    # Circuit breaker shared across instances: monotonic-clock deadline
+    # before which all calls short-circuit to fallback content
+    _rate_limit_until = 0.0
+
+    def __init__(self):
+        if not Config.OPENROUTER_API_KEY:
+            log.warning("⚠️ OPENROUTER_API_KEY is not configured - API calls will fail")
+
+        # Clients are built lazily on first use, so constructing the
+        # generator (dry runs, imports, --help) does no TLS/socket work
+        self._client = None
+        self._aclient = None
+        # Exact-match content cache: repeated trends skip the API entirely
+        self._memory_cache = {}
+        self._disk_cache = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._disk_cache = diskcache.Cache(os.path.join(Config.CACHE_DIR, 'content'))
+            except Exception as e:
+                log.warning(f"⚠️ Could not open content disk cache: {e}")
+
+        log.info(f"✅ Content Generator initialized with model: {Config.AI_MODEL}")
+
+    @property
+    def client(self):
+        """Sync OpenAI client, created on first use"""
+        if self._client is None:
+            if not Config.OPENROUTER_API_KEY:
+                raise ValueError("OPENROUTER_API_KEY is not configured")
+            # Lazy import, same rationale as AICategorizer
+            from openai import OpenAI
+            from agents._http import SHARED_HTTPX
+            self._client = OpenAI(
+                api_key=Config.OPENROUTER_API_KEY,
+                base_url=Config.OPENROUTER_BASE_URL,
+                http_client=SHARED_HTTPX
+            )
+        return self._client
+
+    @property
+    def aclient(self):
+        """Async OpenAI client, created on first use"""
+        if self._aclient is None:
+            if not Config.OPENROUTER_API_KEY:
+                raise ValueError("OPENROUTER_API_KEY is not configured")
+            from openai import AsyncOpenAI
+            from agents._http import SHARED_ASYNC_HTTPX
+            self._aclient = AsyncOpenAI(
+                api_key=Config.OPENROUTER_API_KEY,
+                base_url=Config.OPENROUTER_BASE_URL,
+                http_client=SHARED_ASYNC_HTTPX
+            )
+        return self._aclient
+
+    def _cache_get(self, trend, category):
+        """Look up previously generated content (memory first, then disk)"""
+        key = _content_key(trend, category)
+        entry = self._memory_cache.get(key)
+        if entry is not None:
+            content, expires = entry
+            if time.time() < expires:
+                self._cache_hits += 1
+                return content
+            del self._memory_cache[key]
+        if self._disk_cache is not None:
+            content = self._disk_cache.get(key)
+            if content is not None:
+                self._memory_cache[key] = (content, time.time() + _CONTENT_CACHE_TTL)
+                self._cache_hits += 1
+                return content
+        self._cache_misses += 1
+        return None
+
+    def cache_stats(self):
+        """Hit/miss counters and tier sizes for the /cache-stats route"""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'memory_entries': len(self._memory_cache),
+            'disk_enabled': self._disk_cache is not None
+        }
+
+    def _cache_put(self, trend, category, content):
+        """Store generated content in both cache tiers with a TTL"""
+        key = _content_key(trend, category)
+        self._memory_cache[key] = (content, time.time() + _CONTENT_CACHE_TTL)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(key, content, expire=_CONTENT_CACHE_TTL)
+            except Exception:
+                pass
+    
+    def generate_content(self, trend, category):
+        """Generate social media content using AI (GPT-2 Agent) with retry logic"""
+        if not trend or category == "Not Relevant":
+            return self.get_fallback_content(trend, category)
+
+        cached = self._cache_get(trend, category)
+        if cached is not None:
+            return cached
+
+        # Provider recently marked down - don't pay the retry penalty
+        # again for every trend in the batch
+        if time.monotonic() < ContentGenerator._rate_limit_until:
+            return self.get_fallback_content(trend, category)
+
+        max_retries = 3
+        base_delay = 2
+
+        for attempt in range(max_retries):
+            try:
+                get_sync_rate_limiter().acquire()
+                response = self.client.chat.completions.create(
+                    model=Config.AI_MODEL,
+                    messages=self._build_messages(trend, category),
+                    max_tokens=Config.MAX_TOKENS,
+                    temperature=Config.TEMPERATURE,
+                    extra_headers={
+                        "HTTP-Referer": Config.APP_URL,
+                        "X-Title": Config.APP_NAME
+                    }
+                )
+                
+                content_text = response.choices[0].message.content
+                
+                # Clean DeepSeek's thinking process
+                content_text = self._clean_deepseek_response(content_text)
+                
+                parsed_content = self.parse_content(content_text)
+                
+                # Validate parsed content
+                if not any(parsed_content.values()):
+                    log.warning(f"   ⚠️ Empty content generated, using fallback")
+                    return self.get_fallback_content(trend, category)
+
+                self._cache_put(trend, category, parsed_content)
+                return parsed_content
+                
+            except Exception as e:
+                error_str = str(e)
+                
+                # Check if it's a rate limit error
+                if "429" in error_str or "rate" in error_str.lower():
+                    if attempt < max_retries - 1:
+                        wait_time = base_delay * (2 ** attempt)
+                        log.warning(f"   ⏳ Rate limited, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        log.error(f"   ❌ Rate limit exceeded, using fallback content")
+                        ContentGenerator._rate_limit_until = time.monotonic() + _BREAKER_COOLDOWN
+                        return self.get_fallback_content(trend, category)
+                else:
+                    log.error(f"   ❌ Content generation error: {e}")
+                    return self.get_fallback_content(trend, category)
+        
+        return self.get_fallback_content(trend, category)
+    
+    def generate_content_streaming(self, trend, category):
+        """Yield (section_key, text) pairs as each section finishes streaming.
+
+        With stream=True a section is complete as soon as the next header
+        arrives, so downstream consumers can start using the Instagram
+        caption while the YouTube script is still being generated.
+        """
+        if not trend or category == "Not Relevant":
+            yield from self.get_fallback_content(trend, category).items()
+            return
+
+        emitted = set()
+        try:
+            get_sync_rate_limiter().acquire()
+            stream = self.client.chat.completions.create(
+                model=Config.AI_MODEL,
+                messages=self._build_messages(trend, category),
+                max_tokens=Config.MAX_TOKENS,
+                temperature=Config.TEMPERATURE,
+                stream=True,
+                extra_headers={
+                    "HTTP-Referer": Config.APP_URL,
+                    "X-Title": Config.APP_NAME
+                }
+            )
+
+            buffer = ''
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                buffer += delta
+
+                # Discard <think> blocks the moment they close; an open
+                # block may still contain fake headers, so wait it out
+                if '<think>' in buffer:
+                    if '</think>' not in buffer:
+                        continue
+                    buffer = _THINK_RE.sub('', buffer)
+
+                # Every section except the last is bounded by the next
+                # header, so it is complete
+                parts = _SECTION_RE.split(buffer)
+                for header, body in list(zip(parts[1::2], parts[2::2]))[:-1]:
+                    key = _LABEL_MAP[header.upper()]
+                    if key not in emitted:
+                        emitted.add(key)
+                        yield key, body.strip()
+
+            # Stream closed - emit whatever sections remain
+            parts = _SECTION_RE.split(buffer.strip())
+            for header, body in zip(parts[1::2], parts[2::2]):
+                key = _LABEL_MAP[header.upper()]
+                if key not in emitted:
+                    emitted.add(key)
+                    yield key, body.strip()
+
+        except Exception as e:
+            log.error(f"   ❌ Streaming generation error: {e}")
+            for key, text in self.get_fallback_content(trend, category).items():
+                if key not in emitted:
+                    yield key, text
+
+    async def agenerate_content_streaming(self, trend, category):
+        """Async counterpart of generate_content_streaming.
+
+        Bounded by the shared semaphore, so a batch of trends can stream
+        concurrently while each consumer still receives sections as soon
+        as they are complete.
+        """
+        if not trend or category == "Not Relevant":
+            for item in self.get_fallback_content(trend, category).items():
+                yield item
+            return
+
+        emitted = set()
+        async with get_semaphore():
+            try:
+                await get_rate_limiter().acquire()
+                stream = await self.aclient.chat.completions.create(
+                    model=Config.AI_MODEL,
+                    messages=self._build_messages(trend, category),
+                    max_tokens=Config.MAX_TOKENS,
+                    temperature=Config.TEMPERATURE,
+                    stream=True,
+                    extra_headers={
+                        "HTTP-Referer": Config.APP_URL,
+                        "X-Title": Config.APP_NAME
+                    }
+                )
+
+                buffer = ''
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    buffer += delta
+
+                    if '<think>' in buffer:
+                        if '</think>' not in buffer:
+                            continue
+                        buffer = _THINK_RE.sub('', buffer)
+
+                    parts = _SECTION_RE.split(buffer)
+                    for header, body in list(zip(parts[1::2], parts[2::2]))[:-1]:
+                        key = _LABEL_MAP[header.upper()]
+                        if key not in emitted:
+                            emitted.add(key)
+                            yield key, body.strip()
+
+                parts = _SECTION_RE.split(buffer.strip())
+                for header, body in zip(parts[1::2], parts[2::2]):
+                    key = _LABEL_MAP[header.upper()]
+                    if key not in emitted:
+                        emitted.add(key)
+                        yield key, body.strip()
+
+            except Exception as e:
+                log.error(f"   ❌ Streaming generation error: {e}")
+                for key, text in self.get_fallback_content(trend, category).items():
+                    if key not in emitted:
+                        yield key, text
+
+    async def agenerate_content(self, trend, category):
+        """Async version of generate_content, bounded by the shared semaphore"""
+        if not trend or category == "Not Relevant":
+            return self.get_fallback_content(trend, category)
+
+        cached = self._cache_get(trend, category)
+        if cached is not None:
+            return cached
+
+        if time.monotonic() < ContentGenerator._rate_limit_until:
+            return self.get_fallback_content(trend, category)
+
+        max_retries = 3
+        base_delay = 2
+        sem = get_semaphore()
+
+        async with sem:
+            for attempt in range(max_retries):
+                try:
+                    await get_rate_limiter().acquire()
+                    response = await self.aclient.chat.completions.create(
+                        model=Config.AI_MODEL,
+                        messages=self._build_messages(trend, category),
+                        max_tokens=Config.MAX_TOKENS,
+                        temperature=Config.TEMPERATURE,
+                        extra_headers={
+                            "HTTP-Referer": Config.APP_URL,
+                            "X-Title": Config.APP_NAME
+                        }
+                    )
+
+                    content_text = self._clean_deepseek_response(
+                        response.choices[0].message.content
+                    )
+                    parsed_content = self.parse_content(content_text)
+
+                    if not any(parsed_content.values()):
+                        log.warning(f"   ⚠️ Empty content generated, using fallback")
+                        return self.get_fallback_content(trend, category)
+
+                    self._cache_put(trend, category, parsed_content)
+                    return parsed_content
+
+                except Exception as e:
+                    error_str = str(e)
+
+                    if "429" in error_str or "rate" in error_str.lower():
+                        if attempt < max_retries - 1:
+                            wait_time = base_delay * (2 ** attempt)
+                            log.warning(f"   ⏳ Rate limited, waiting {wait_time}s... (attempt {attempt + 1}/{max_retries})")
+                            await asyncio.sleep(wait_time)
+                            continue
+                        else:
+                            log.error(f"   ❌ Rate limit exceeded, using fallback content")
+                            ContentGenerator._rate_limit_until = time.monotonic() + _BREAKER_COOLDOWN
+                            return self.get_fallback_content(trend, category)
+                    else:
+                        log.error(f"   ❌ Content generation error: {e}")
+                        return self.get_fallback_content(trend, category)
+
+        return self.get_fallback_content(trend, category)
+
+    async def abatch_generate(self, trends_with_categories):
+        """Generate content for many (trend, category) pairs concurrently.
+
+        One failed trend must not sink the whole batch, so exceptions are
+        collected per item and replaced with that trend's fallback content.
+        """
+        results = await asyncio.gather(
+            *[self.agenerate_content(trend, category)
+              for trend, category in trends_with_categories],
+            return_exceptions=True
+        )
+        contents = []
+        for (trend, category), result in zip(trends_with_categories, results):
+            if isinstance(result, BaseException):
+                log.error(f"   ❌ Batch generation failed for '{trend[:50]}': {result}")
+                result = self.get_fallback_content(trend, category)
+            contents.append(result)
+        return contents
+
+    def batch_generate(self, trends_with_categories):
+        """Sync wrapper around abatch_generate"""
+        return asyncio.run(self.abatch_generate(trends_with_categories))
+
+    def _clean_deepseek_response(self, response):
+        """Remove DeepSeek R1's thinking tags"""
+        return _THINK_RE.sub('', response).strip()
+    
+    def _build_messages(self, trend, category):
+        """Assemble the chat messages for a generation call.
+
+        The static per-category scaffold goes in the system message and
+        only the trend varies in the user turn, keeping the cacheable
+        prompt prefix as long as possible.
+        """
+        system = SYSTEM_PROMPTS.get(category)
+        if system is None:
+            # Unexpected category - build the same shape on the fly
+            system = (
+                _SYSTEM_MESSAGE
+                + "\n\n" + _PROMPT_PREFIX
+                + f"\n\nCATEGORY: {category}"
+                + f"\nLINK_TYPE: {self._get_link_placeholder(category)}"
+            )
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": f"TREND: {trend}"}
+        ]
+
+
+    def _get_link_placeholder(self, category):
+        """Get appropriate link placeholder based on category"""
+        return _LINK_PLACEHOLDER.get(category, "official link")
+    
+    def parse_content(self, content_text):
+        """Parse the structured AI response in one regex pass"""
+        content = {
+            'instagram': '',
+            'blog': '',
+            'youtube': '',
+            'thumbnail': ''
+        }
+
+        parts = _SECTION_RE.split(content_text)
+        if len(parts) < 3:
+            # Model didn't follow the section format - try line-by-line
+            return self._parse_content_lines(content_text)
+
+        for header, body in zip(parts[1::2], parts[2::2]):
+            content[_LABEL_MAP[header.upper()]] = _clean_section(body)
+
+        return content
+
+    def _parse_content_lines(self, content_text):
+        """Line-by-line fallback parser for non-conforming responses"""
+        # Collect fragments per section and join once at the end - repeated
+        # `+= ' ' + line` copies the whole buffer on every append
+        buckets = {key: [] for key in ('instagram', 'blog', 'youtube', 'thumbnail')}
+        current_section = None
+
+        for line in content_text.split('\n'):
+            line_stripped = line.strip()
+
+            # Header lines resolve through a single compiled match that
+            # also captures any content trailing the colon
+            m = _HDR_LINE_RE.match(line_stripped)
+            if m:
+                current_section = _LABEL_MAP[m.group(1).upper()]
+                tail = m.group(2).strip()
+                if tail:
+                    buckets[current_section].append(tail)
+                continue
+
+            # Content line inside the current section
+            if current_section and line_stripped:
+                # Skip separator lines: one slice + set lookup instead
+                # of three startswith calls
+                if line_stripped[:3] in _SEP_PREFIXES:
+                    continue
+                buckets[current_section].append(line_stripped)
+
+        # Join fragments and remove any remaining section markers
+        content = {key: ' '.join(fragments).strip() for key, fragments in buckets.items()}
+        for key in content:
+            for header in _LABEL_MAP:
+                content[key] = content[key].replace(header + ':', '').strip()
+
+        return content
+    
+    def get_fallback_content(self, trend, category):
+        """Fallback content if AI fails"""
+        hashtags = _HASHTAGS_MAP.get(category, "#GovernmentJobs #JobUpdate #JobYaari")
+        link_text = _LINK_MAP.get(category, "Visit: [Official Link]")
+
+        return {
+            'instagram': _INSTAGRAM_TMPL.format(trend=trend, link_text=link_text, hashtags=hashtags),
+            'blog': _BLOG_TMPL.format(trend=trend, category=category, link_text=link_text),
+            'youtube': _YOUTUBE_TMPL.format(trend=trend, link_text=link_text),
+            'thumbnail': _THUMBNAIL_TMPL.format(category_upper=category.upper(), trend_short=trend[:30])
+        }
+    
+    def validate_content(self, content):
+        """Validate generated content quality"""
+        issues = []
+        
+        if not content['instagram'] or len(content['instagram']) < 20:
+            issues.append("Instagram post too short")
+        
+        if not content['blog'] or len(content['blog']) < 50:
+            issues.append("Blog draft too short")
+        
+        if not content['youtube'] or len(content['youtube']) < 30:
+            issues.append("YouTube script too short")
+        
+        if not content['thumbnail']:
+            issues.append("Thumbnail idea missing")
+        
         return len(issues) == 0, issues
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Combined classify-and-generate pipeline.
+
+For each relevant trend the workflow normally pays two sequential LLM
+round-trips: AICategorizer.categorize, then
+ContentGenerator.generate_content. AgentPipeline collapses them into a
+single chat completion that returns both the category and the content
+as one JSON object, halving per-trend network latency.
+
+The web workflow deliberately does not use this class: its batched
+two-phase path (categorize_many + batch_generate) already amortizes
+the round-trips across a whole batch. AgentPipeline is exposed for
+single-trend callers - scripts and future endpoints - where per-trend
+latency matters more than batch throughput.
+"""
+import json
+import logging
+import re
+
+from config import Config
+
+log = logging.getLogger(__name__)
+
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
+_COMBINED_INSTRUCTIONS = """You are JobYaari's job-trend agent for Indian government job updates.
+
+For the given trend, return ONE JSON object with exactly these keys:
+- "category": one of "Admit Card", "Job Notification", "Result", "Not Relevant"
+- "instagram": 2-3 lines with emojis and 3-5 hashtags, urgent and engaging
+- "blog": 120-150 words with hook, key details, benefits, call-to-action
+- "youtube": 30-second script with visual cues in [brackets]
+- "thumbnail": eye-catching thumbnail description (text, colors, layout)
+
+If the category is "Not Relevant", set the four content fields to empty strings.
+Return ONLY the JSON object, nothing else."""
+
+
+class AgentPipeline:
+    """Bridges AICategorizer and ContentGenerator into one LLM call per trend"""
+
+    def __init__(self, categorizer, content_generator):
+        self.categorizer = categorizer
+        self.content_generator = content_generator
+
+    def classify_and_generate(self, trend):
+        """Categorize a trend and generate its content with one API call.
+
+        Returns (category, content) where content is None for trends that
+        are not relevant. Falls back to the two-call path when the model
+        returns malformed JSON.
+        """
+        # When keywords already decide the category, only the content
+        # needs the LLM - a single call either way
+        if Config.LLM_FALLBACK_ONLY_AMBIGUOUS:
+            category = self.categorizer._keyword_categorize(trend)
+            if category is not None:
+                return category, self.content_generator.generate_content(trend, category)
+
+        try:
+            response = self.categorizer.client.chat.completions.create(
+                model=Config.AI_MODEL,
+                messages=[
+                    {"role": "system", "content": _COMBINED_INSTRUCTIONS},
+                    {"role": "user", "content": f'Trend: "{trend}"'}
+                ],
+                max_tokens=Config.MAX_TOKENS,
+                temperature=Config.TEMPERATURE,
+                response_format={"type": "json_object"},
+                extra_headers={
+                    "HTTP-Referer": Config.APP_URL,
+                    "X-Title": Config.APP_NAME
+                }
+            )
+            payload = self._parse_response(response.choices[0].message.content)
+
+            category = self.categorizer._validate_category(payload.get('category', ''))
+            self.categorizer._cache_put(trend, category)
+            if category == "Not Relevant":
+                return category, None
+
+            content = {
+                'instagram': str(payload.get('instagram', '')).strip(),
+                'blog': str(payload.get('blog', '')).strip(),
+                'youtube': str(payload.get('youtube', '')).strip(),
+                'thumbnail': str(payload.get('thumbnail', '')).strip()
+            }
+            if not any(content.values()):
+                content = self.content_generator.get_fallback_content(trend, category)
+            return category, content
+
+        except Exception as e:
+            log.warning("⚠️ Combined call failed (%s), falling back to two calls", e)
+            return self._classify_and_generate_separately(trend)
+
+    def _classify_and_generate_separately(self, trend):
+        """The original two-call path, used when the combined call fails"""
+        category = self.categorizer.categorize(trend)
+        if category == "Not Relevant":
+            return category, None
+        return category, self.content_generator.generate_content(trend, category)
+
+    @staticmethod
+    def _parse_response(response_text):
+        """Extract the JSON object from the model response"""
+        response_text = _THINK_RE.sub('', response_text).strip()
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start == -1 or end == -1:
+            raise ValueError("no JSON object in combined response")
+        return json.loads(response_text[start:end + 1])
@@ -1,11 +1,32 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import random
+import re
 from datetime import datetime, timedelta
 
+# Pooled session shared by all scraper instances: keeps TCP/TLS
+# connections alive across requests and retries 429/5xx responses with
+# backoff (honoring Retry-After) instead of failing or hammering
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+))
+
 class GoogleTrendsScraper:
     """Scraper for job-related trending topics"""
-    
+
+    # Fixed attribute set - slots drop the per-instance __dict__
+    __slots__ = ('job_keywords', '_kw_re', '_sample_trends', '_cursor')
+
     def __init__(self):
         self.job_keywords = [
             'job notification', 'admit card', 'result', 'recruitment',
@@ -13,9 +34,25 @@ class GoogleTrendsScraper:
             'IBPS', 'LIC', 'AIIMS', 'ISRO', 'DRDO', 'ONGC', 'Indian Railway',
             'Police recruitment', 'Army recruitment', 'Navy recruitment'
         ]
-        
-        # Sample trends database (for demo/testing)
-        self.sample_trends = self._generate_sample_trends()
+
+        # One compiled alternation scans all keywords in a single C-level
+        # pass instead of ~20 Python substring checks per trend
+        extra = ['recruitment', 'vacancy', 'hiring', 'notification']
+        self._kw_re = re.compile(
+            r'(?i)\b(?:' + '|'.join(re.escape(k) for k in self.job_keywords + extra) + r')\b'
+        )
+
+        # Sample trends database (for demo/testing), generated lazily on
+        # first access and served in rotating slices by get_job_trends
+        self._sample_trends = None
+        self._cursor = 0
+
+    @property
+    def sample_trends(self):
+        """Sample trend pool, built on first use"""
+        if self._sample_trends is None:
+            self._sample_trends = self._generate_sample_trends()
+        return self._sample_trends
     
     def _generate_sample_trends(self):
         """Generate realistic sample trends for testing"""
@@ -51,32 +88,28 @@ class GoogleTrendsScraper:
             "{org} final result 2025 published"
         ]
         
+        # Batch the RNG draws (one random.choices call per field) instead
+        # of three random.choice calls per trend
+        orgs = random.choices(organizations, k=15)
+        posts = random.choices(positions, k=15)
+
         trends = []
-        
+
         # Generate admit card trends
-        for _ in range(5):
-            org = random.choice(organizations)
-            pos = random.choice(positions)
-            template = random.choice(admit_card_templates)
-            trend = template.format(org=org, position=pos)
-            trends.append(trend)
-        
+        for org, pos, template in zip(orgs[:5], posts[:5],
+                                      random.choices(admit_card_templates, k=5)):
+            trends.append(template.format(org=org, position=pos))
+
         # Generate job notification trends
-        for _ in range(6):
-            org = random.choice(organizations)
-            pos = random.choice(positions)
-            num = random.choice([500, 1000, 2000, 5000, 10000])
-            template = random.choice(job_notification_templates)
-            trend = template.format(org=org, position=pos, num=num)
-            trends.append(trend)
-        
+        nums = random.choices([500, 1000, 2000, 5000, 10000], k=6)
+        for org, pos, num, template in zip(orgs[5:11], posts[5:11], nums,
+                                           random.choices(job_notification_templates, k=6)):
+            trends.append(template.format(org=org, position=pos, num=num))
+
         # Generate result trends
-        for _ in range(4):
-            org = random.choice(organizations)
-            pos = random.choice(positions)
-            template = random.choice(result_templates)
-            trend = template.format(org=org, position=pos)
-            trends.append(trend)
+        for org, pos, template in zip(orgs[11:], posts[11:],
+                                      random.choices(result_templates, k=4)):
+            trends.append(template.format(org=org, position=pos))
         
         # Add some non-relevant trends for testing categorization
         non_relevant = [
@@ -100,9 +133,19 @@ class GoogleTrendsScraper:
         # - News aggregators
         # - Social media APIs
         
-        # For now, return sample trends with some randomization
-        trends = random.sample(self.sample_trends, min(15, len(self.sample_trends)))
-        
+        # For now, serve a slice of the precomputed pool via a rotating
+        # cursor instead of re-sampling the whole list on every call
+        pool = self.sample_trends
+        k = min(15, len(pool))
+        end = self._cursor + k
+        trends = pool[self._cursor:end]
+        if end > len(pool):
+            trends += pool[:end % len(pool)]
+        self._cursor = end % len(pool)
+        if self._cursor == 0:
+            # Full rotation done - reshuffle so runs don't repeat in order
+            random.shuffle(pool)
+
         print(f"📊 Scraped {len(trends)} trends")
         return trends
     
@@ -127,20 +170,14 @@ class GoogleTrendsScraper:
     
     def filter_job_trends(self, trends):
         """Filter trends to include only job-related content"""
-        filtered = []
-        
-        for trend in trends:
-            trend_lower = trend.lower()
-            
-            # Check if trend contains job-related keywords
-            if any(keyword.lower() in trend_lower for keyword in self.job_keywords):
-                filtered.append(trend)
-            
-            # Additional checks for common job-related patterns
-            elif any(word in trend_lower for word in ['recruitment', 'vacancy', 'hiring', 'notification']):
-                filtered.append(trend)
-        
-        return filtered
+        # With thousands of trends (RSS aggregation), run the alternation
+        # regex over the whole array in C via pandas instead of a Python
+        # loop; below that the list comprehension is cheaper to set up
+        if len(trends) >= 1000:
+            import pandas as pd
+            s = pd.Series(trends)
+            return s[s.str.contains(self._kw_re)].tolist()
+        return [trend for trend in trends if self._kw_re.search(trend)]
     
     def scrape_from_job_portals(self):
         """
@@ -149,9 +186,12 @@ class GoogleTrendsScraper:
         
         Potential sources:
         - Sarkari Result
-        - Rojgar Result  
+        - Rojgar Result
         - FreeJobAlert
         - Employment News
+
+        Fetch pages through the module-level SESSION so portal requests
+        reuse pooled connections and get retry/backoff for free.
         """
         pass
     
@@ -21,6 +21,11 @@ class Config:
     # Model Parameters
     MAX_TOKENS = 1000  # Increased for DeepSeek R1
     TEMPERATURE = 0.7
+    CONCURRENCY = int(os.getenv('CONCURRENCY', 8))  # Max parallel API calls in batch mode
+    OPENROUTER_RPM = int(os.getenv('OPENROUTER_RPM', 30))  # Requests/minute budget (0 = unlimited)
+
+    # Only call the LLM when keyword matching is ambiguous (saves API calls)
+    LLM_FALLBACK_ONLY_AMBIGUOUS = os.getenv('LLM_FALLBACK_ONLY_AMBIGUOUS', 'True').lower() == 'true'
     
     # Flask Settings
     DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
@@ -28,6 +33,7 @@ class Config:
     
     # Data Storage
     CSV_FILE = "job_trends_data.csv"
+    CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
     
     # App Metadata for OpenRouter
     APP_NAME = "JobYaari AI Agent"
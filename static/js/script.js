@@ -14,38 +14,71 @@ async function runAgent() {
             <div class="loading-spinner"></div>
             <p>🤖 AI Agent is running... This may take 1-2 minutes.</p>
             <p><small>Scraping trends → AI categorization → Content generation → Updating sheets</small></p>
+            <p><small id="jobPhase">Starting job...</small></p>
         </div>
     `;
-    
+
+    let progress = null;
     try {
-        const response = await fetch('/run-agent', { 
+        // POST returns 202 with a job id immediately; the workflow runs
+        // in the background and we follow it from here
+        const response = await fetch('/run-agent', {
             method: 'POST',
-            headers: { 
+            headers: {
                 'Content-Type': 'application/json',
                 'X-Requested-With': 'XMLHttpRequest'
             }
         });
-        
+
         const data = await response.json();
-        
-        if (data.success) {
-            showSuccess(`✅ ${data.message}`);
-            
-            if (data.results && data.results.length > 0) {
-                displayResults(data.results);
-            } else {
-                resultsDiv.innerHTML = '<div class="result-item"><p>No relevant trends found in this batch.</p></div>';
-            }
-        } else {
+        if (!data.success) {
             showError(`❌ Error: ${data.error}`);
+            updateStats();
+            return;
+        }
+
+        // Live phase updates via the job's SSE stream
+        progress = new EventSource(data.events_url);
+        progress.onmessage = function(e) {
+            const event = JSON.parse(e.data);
+            const phaseEl = document.getElementById('jobPhase');
+            if (phaseEl) phaseEl.textContent = `${event.phase}: ${event.message}`;
+        };
+
+        // Poll the status endpoint until the job finishes
+        const result = await pollJobStatus(data.status_url);
+
+        showSuccess(`✅ ${result.message}`);
+        if (result.results && result.results.length > 0) {
+            displayResults(result.results);
+        } else {
+            resultsDiv.innerHTML = '<div class="result-item"><p>No relevant trends found in this batch.</p></div>';
         }
     } catch (error) {
-        showError(`❌ Network error: ${error.message}`);
+        showError(`❌ Error: ${error.message}`);
+    } finally {
+        if (progress) progress.close();
     }
-    
+
     updateStats();
 }
 
+// Poll /run-agent/status/<job_id> until the workflow finishes
+async function pollJobStatus(statusUrl) {
+    while (true) {
+        const response = await fetch(statusUrl);
+        const data = await response.json();
+
+        if (!data.success || data.state === 'failed') {
+            throw new Error(data.error || 'Workflow failed');
+        }
+        if (data.state === 'finished') {
+            return data.result;
+        }
+        await new Promise(resolve => setTimeout(resolve, 2000));
+    }
+}
+
 // Display results
 function displayResults(results) {
     const resultsDiv = document.getElementById('results');
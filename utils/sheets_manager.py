@@ -1,322 +1,648 @@
-import pandas as pd
-import os
-from datetime import datetime
-from config import Config
-
-# Google Sheets imports
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
-    print("⚠️ gspread not available - Google Sheets integration disabled")
-
-class GoogleSheetsManager:
-    """Manages data storage in CSV + Google Sheets (as per assignment)"""
-    
-    def __init__(self):
-        self.csv_file = Config.CSV_FILE
-        self.sheet_id = Config.GOOGLE_SHEET_ID
-        self.credentials_file = Config.GOOGLE_CREDENTIALS_FILE
-        
-        # Setup CSV (fallback storage)
-        self.setup_csv()
-        
-        # Setup Google Sheets (primary storage as per assignment)
-        self.google_sheet = None
-        self.setup_google_sheets()
-    
-    def setup_csv(self):
-        """Initialize CSV file with headers"""
-        try:
-            if not os.path.exists(self.csv_file):
-                df = pd.DataFrame(columns=[
-                    'timestamp', 'trend', 'category', 'instagram_post', 
-                    'blog_draft', 'youtube_script', 'thumbnail_idea', 'status'
-                ])
-                df.to_csv(self.csv_file, index=False, encoding='utf-8')
-                print(f"✅ Created new CSV file: {self.csv_file}")
-            else:
-                df = pd.read_csv(self.csv_file)
-                print(f"✅ Loaded existing CSV: {len(df)} records")
-        except Exception as e:
-            print(f"❌ Error setting up CSV: {e}")
-            raise
-    
-    def setup_google_sheets(self):
-        """Initialize Google Sheets connection (REQUIRED by assignment)"""
-        if not GSPREAD_AVAILABLE:
-            print("⚠️ Google Sheets integration not available - install gspread")
-            return
-        
-        if not self.sheet_id:
-            print("⚠️ GOOGLE_SHEET_ID not configured - Google Sheets disabled")
-            return
-        
-        if not os.path.exists(self.credentials_file):
-            print(f"⚠️ Google credentials file not found: {self.credentials_file}")
-            print("   Download credentials from Google Cloud Console")
-            print("   https://console.cloud.google.com/apis/credentials")
-            return
-        
-        try:
-            # Define the required scopes
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # Authenticate
-            creds = Credentials.from_service_account_file(
-                self.credentials_file,
-                scopes=scopes
-            )
-            client = gspread.authorize(creds)
-            
-            # Open the sheet
-            self.google_sheet = client.open_by_key(self.sheet_id).sheet1
-            
-            # Setup headers if empty
-            headers = self.google_sheet.row_values(1)
-            if not headers:
-                self.google_sheet.append_row([
-                    'Timestamp', 'Trend', 'Category', 'Instagram Post',
-                    'Blog Draft', 'YouTube Script', 'Thumbnail Idea', 'Status'
-                ])
-            
-            print(f"✅ Connected to Google Sheet: {self.sheet_id}")
-            
-        except Exception as e:
-            print(f"❌ Error connecting to Google Sheets: {e}")
-            print("   Falling back to CSV-only mode")
-            self.google_sheet = None
-    
-    def add_row(self, data):
-        """Add a new row to CSV AND Google Sheets"""
-        # Create row data
-        new_row = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'trend': str(data.get('trend', '')),
-            'category': str(data.get('category', '')),
-            'instagram_post': str(data.get('instagram_post', '')),
-            'blog_draft': str(data.get('blog_draft', '')),
-            'youtube_script': str(data.get('youtube_script', '')),
-            'thumbnail_idea': str(data.get('thumbnail_idea', '')),
-            'status': str(data.get('status', 'Pending Review'))
-        }
-        
-        # Add to CSV
-        csv_success = self._add_to_csv(new_row)
-        
-        # Add to Google Sheets (if available)
-        sheets_success = self._add_to_google_sheets(new_row)
-        
-        if csv_success or sheets_success:
-            print(f"✅ Saved: {new_row['trend'][:50]}... [{new_row['category']}]")
-            return True
-        return False
-    
-    def _add_to_csv(self, new_row):
-        """Add row to CSV file"""
-        try:
-            if os.path.exists(self.csv_file):
-                df = pd.read_csv(self.csv_file, encoding='utf-8')
-            else:
-                df = pd.DataFrame()
-            
-            # Check for duplicates
-            if not df.empty and 'trend' in df.columns:
-                if new_row['trend'] in df['trend'].values:
-                    print(f"⚠️ Duplicate in CSV: {new_row['trend'][:50]}...")
-                    return False
-            
-            # Append and save
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            df.to_csv(self.csv_file, index=False, encoding='utf-8')
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error adding to CSV: {e}")
-            return False
-    
-    def _add_to_google_sheets(self, new_row):
-        """Add row to Google Sheets"""
-        if not self.google_sheet:
-            return False
-        
-        try:
-            # Check for duplicates
-            all_trends = self.google_sheet.col_values(2)  # Column B (Trend)
-            if new_row['trend'] in all_trends:
-                print(f"⚠️ Duplicate in Google Sheets: {new_row['trend'][:50]}...")
-                return False
-            
-            # Append row
-            row_values = [
-                new_row['timestamp'],
-                new_row['trend'],
-                new_row['category'],
-                new_row['instagram_post'],
-                new_row['blog_draft'],
-                new_row['youtube_script'],
-                new_row['thumbnail_idea'],
-                new_row['status']
-            ]
-            
-            self.google_sheet.append_row(row_values)
-            print(f"✅ Added to Google Sheets")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error adding to Google Sheets: {e}")
-            return False
-    
-    def get_all_data(self):
-        """Get all data from CSV (primary) or Google Sheets (fallback)"""
-        try:
-            # Try CSV first
-            if os.path.exists(self.csv_file):
-                df = pd.read_csv(self.csv_file, encoding='utf-8')
-                data = df.to_dict('records')
-                
-                # Clean NaN values
-                for item in data:
-                    for key, value in item.items():
-                        if pd.isna(value):
-                            item[key] = ''
-                
-                return data
-            
-            # Fallback to Google Sheets
-            elif self.google_sheet:
-                records = self.google_sheet.get_all_records()
-                return records
-            
-            return []
-            
-        except Exception as e:
-            print(f"❌ Error reading data: {e}")
-            return []
-    
-    def update_status(self, trend, new_status):
-        """Update approval status in BOTH CSV and Google Sheets"""
-        csv_success = self._update_status_csv(trend, new_status)
-        sheets_success = self._update_status_sheets(trend, new_status)
-        
-        return csv_success or sheets_success
-    
-    def _update_status_csv(self, trend, new_status):
-        """Update status in CSV"""
-        try:
-            if not os.path.exists(self.csv_file):
-                return False
-            
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            mask = df['trend'] == trend
-            
-            if not mask.any():
-                return False
-            
-            df.loc[mask, 'status'] = new_status
-            df.to_csv(self.csv_file, index=False, encoding='utf-8')
-            
-            print(f"✅ Updated CSV: {trend[:50]}... → {new_status}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error updating CSV status: {e}")
-            return False
-    
-    def _update_status_sheets(self, trend, new_status):
-        """Update status in Google Sheets"""
-        if not self.google_sheet:
-            return False
-        
-        try:
-            # Find the row
-            all_trends = self.google_sheet.col_values(2)  # Column B
-            
-            if trend not in all_trends:
-                return False
-            
-            row_index = all_trends.index(trend) + 1  # +1 because sheets are 1-indexed
-            
-            # Update status column (Column H = 8)
-            self.google_sheet.update_cell(row_index, 8, new_status)
-            
-            print(f"✅ Updated Google Sheet: {trend[:50]}... → {new_status}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error updating Google Sheets status: {e}")
-            return False
-    
-    def get_by_status(self, status):
-        """Get all trends with specific status"""
-        all_data = self.get_all_data()
-        return [item for item in all_data if item.get('status') == status]
-    
-    def get_pending_reviews(self):
-        """Get all trends pending review"""
-        return self.get_by_status('Pending Review')
-    
-    def get_approved_content(self):
-        """Get all approved content (READY FOR PUBLISHING)"""
-        return self.get_by_status('Approved')
-    
-    def get_rejected_content(self):
-        """Get all rejected content"""
-        return self.get_by_status('Rejected')
-    
-    def get_by_category(self, category):
-        """Get all trends in a specific category"""
-        all_data = self.get_all_data()
-        return [item for item in all_data if item.get('category') == category]
-    
-    def export_to_json(self, filename='export.json'):
-        """Export data to JSON format"""
-        try:
-            import json
-            data = self.get_all_data()
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Exported {len(data)} records to {filename}")
-            return True
-        except Exception as e:
-            print(f"❌ Error exporting to JSON: {e}")
-            return False
-    
-    def get_stats(self):
-        """Get statistics about stored data"""
-        try:
-            all_data = self.get_all_data()
-            
-            stats = {
-                'total_records': len(all_data),
-                'by_status': {},
-                'by_category': {},
-                'recent_updates': []
-            }
-            
-            for item in all_data:
-                status = item.get('status', 'Unknown')
-                stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-                
-                category = item.get('category', 'Unknown')
-                stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
-            
-            if all_data:
-                stats['recent_updates'] = sorted(
-                    all_data,
-                    key=lambda x: x.get('timestamp', ''),
-                    reverse=True
-                )[:5]
-            
-            return stats
-            
-        except Exception as e:
-            print(f"❌ Error getting stats: {e}")
-            return None
+import csv
+import logging
+import pandas as pd
+import os
+import threading
+from config import Config
+from utils.helpers import now_timestamp, save_to_json
+
+log = logging.getLogger(__name__)
+
+# CSV column order - must match the header written by setup_csv
+FIELDS = ('timestamp', 'trend', 'category', 'instagram_post',
+          'blog_draft', 'youtube_script', 'thumbnail_idea', 'status')
+
+# Every column is text; telling read_csv so up front skips its per-read
+# type inference pass over the long content fields
+_DTYPES = {field: 'string' for field in FIELDS}
+
+# Google Sheets imports
+try:
+    import gspread
+    from google.oauth2.service_account import Credentials
+    from google.auth.transport.requests import AuthorizedSession
+    from requests.adapters import HTTPAdapter
+    GSPREAD_AVAILABLE = True
+except ImportError:
+    GSPREAD_AVAILABLE = False
+    log.warning("⚠️ gspread not available - Google Sheets integration disabled")
+
+class GoogleSheetsManager:
+    """Manages data storage in CSV + Google Sheets (as per assignment)"""
+    
+    def __init__(self):
+        self.csv_file = Config.CSV_FILE
+        self.sheet_id = Config.GOOGLE_SHEET_ID
+        self.credentials_file = Config.GOOGLE_CREDENTIALS_FILE
+        
+        # Bumped on every successful write so readers can cheaply detect
+        # whether their cached view of the data is stale
+        self._data_version = 0
+
+        # Setup CSV (fallback storage)
+        self.setup_csv()
+
+        # Casefolded trends already stored, for O(1) duplicate checks
+        # without a storage round-trip
+        self._trend_index = self._load_trend_index()
+
+        # In-memory mirror of all stored rows: dashboard reads come from
+        # this list instead of re-reading the CSV (or the Sheets API)
+        # on every poll. Hydrated lazily on first read; writers keep it
+        # in sync, and an mtime check catches external edits to the CSV.
+        self._rows = None
+        self._rows_mtime = None
+        self._rows_lock = threading.RLock()
+
+        # Inverted indexes over the mirror (status/category -> row
+        # positions), built alongside it, so filtered queries cost
+        # O(result) instead of scanning every row
+        self._by_status = None
+        self._by_category = None
+        
+        # Setup Google Sheets (primary storage as per assignment)
+        self.google_sheet = None
+        self.setup_google_sheets()
+
+        # Fold trends already on the sheet into the index (one column
+        # read at startup instead of one per insert), so duplicates that
+        # only exist sheet-side are caught too. The same read seeds the
+        # trend -> sheet-row map used for O(1) status updates.
+        self._row_of = {}
+        self._sheet_rows = None
+        if self.google_sheet:
+            try:
+                sheet_trends = self.google_sheet.col_values(2)[1:]  # skip header
+                self._trend_index.update(
+                    str(t).strip().casefold() for t in sheet_trends
+                )
+                self._row_of = {t: i + 2 for i, t in enumerate(sheet_trends)}
+                self._sheet_rows = len(sheet_trends) + 1
+            except Exception as e:
+                log.warning(f"⚠️ Could not index Sheets trends: {e}")
+    
+    def setup_csv(self):
+        """Initialize CSV file with headers"""
+        try:
+            if not os.path.exists(self.csv_file):
+                # Plain csv.writer - no DataFrame construction just to
+                # emit a header line
+                with open(self.csv_file, 'w', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerow(FIELDS)
+                log.info(f"✅ Created new CSV file: {self.csv_file}")
+            else:
+                # Validate by reading only the header row, not the file
+                with open(self.csv_file, newline='', encoding='utf-8') as f:
+                    header = next(csv.reader(f), None)
+                if header is not None and tuple(header) != FIELDS:
+                    log.warning(f"⚠️ Unexpected CSV header in {self.csv_file}: {header}")
+                else:
+                    log.info(f"✅ Loaded existing CSV: {self.csv_file}")
+        except Exception as e:
+            log.error(f"❌ Error setting up CSV: {e}")
+            raise
+    
+    def _load_trend_index(self):
+        """Build the in-memory trend index from the CSV"""
+        try:
+            if os.path.exists(self.csv_file):
+                df = pd.read_csv(self.csv_file, usecols=['trend'], dtype=_DTYPES,
+                                 encoding='utf-8')
+                return {str(t).strip().casefold() for t in df['trend'].dropna()}
+        except Exception as e:
+            log.warning(f"⚠️ Could not build trend index: {e}")
+        return set()
+
+    def has_trend(self, trend):
+        """Check whether a trend is already stored (O(1), in-memory)"""
+        return str(trend).strip().casefold() in self._trend_index
+
+    def setup_google_sheets(self):
+        """Initialize Google Sheets connection (REQUIRED by assignment)"""
+        if not GSPREAD_AVAILABLE:
+            log.warning("⚠️ Google Sheets integration not available - install gspread")
+            return
+        
+        if not self.sheet_id:
+            log.warning("⚠️ GOOGLE_SHEET_ID not configured - Google Sheets disabled")
+            return
+        
+        if not os.path.exists(self.credentials_file):
+            log.warning(f"⚠️ Google credentials file not found: {self.credentials_file}")
+            log.warning("   Download credentials from Google Cloud Console")
+            log.warning("   https://console.cloud.google.com/apis/credentials")
+            return
+        
+        try:
+            # Define the required scopes
+            scopes = [
+                'https://www.googleapis.com/auth/spreadsheets',
+                'https://www.googleapis.com/auth/drive'
+            ]
+            
+            # Authenticate
+            creds = Credentials.from_service_account_file(
+                self.credentials_file,
+                scopes=scopes
+            )
+
+            # Pre-authorized session with a mounted connection pool:
+            # every Sheets call reuses one TCP+TLS connection instead of
+            # paying a fresh handshake, and transient failures retry
+            session = AuthorizedSession(creds)
+            session.mount('https://', HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=3
+            ))
+            client = gspread.authorize(creds, session=session)
+            
+            # Open the sheet
+            self.google_sheet = client.open_by_key(self.sheet_id).sheet1
+            
+            # Setup headers if empty
+            headers = self.google_sheet.row_values(1)
+            if not headers:
+                self.google_sheet.append_row([
+                    'Timestamp', 'Trend', 'Category', 'Instagram Post',
+                    'Blog Draft', 'YouTube Script', 'Thumbnail Idea', 'Status'
+                ])
+            
+            log.info(f"✅ Connected to Google Sheet: {self.sheet_id}")
+            
+        except Exception as e:
+            log.error(f"❌ Error connecting to Google Sheets: {e}")
+            log.error("   Falling back to CSV-only mode")
+            self.google_sheet = None
+    
+    def _normalize_row(self, data):
+        """Build a stringified, timestamped row from incoming data"""
+        return {
+            'timestamp': now_timestamp(),
+            'trend': str(data.get('trend', '')),
+            'category': str(data.get('category', '')),
+            'instagram_post': str(data.get('instagram_post', '')),
+            'blog_draft': str(data.get('blog_draft', '')),
+            'youtube_script': str(data.get('youtube_script', '')),
+            'thumbnail_idea': str(data.get('thumbnail_idea', '')),
+            'status': str(data.get('status', 'Pending Review'))
+        }
+
+    def add_row(self, data):
+        """Add a new row to CSV AND Google Sheets"""
+        new_row = self._normalize_row(data)
+
+        # One O(1) index lookup replaces the per-backend duplicate scans
+        # (full-CSV read + a col_values API call per insert)
+        if self.has_trend(new_row['trend']):
+            log.warning(f"⚠️ Duplicate skipped: {new_row['trend'][:50]}...")
+            return False
+
+        # Add to CSV
+        csv_success = self._add_to_csv(new_row)
+        
+        # Add to Google Sheets (if available)
+        sheets_success = self._add_to_google_sheets(new_row)
+        
+        if csv_success or sheets_success:
+            self._data_version += 1
+            self._trend_index.add(new_row['trend'].strip().casefold())
+            with self._rows_lock:
+                if self._rows is not None:
+                    self._rows.append(new_row)
+                    self._index_mirror_row(len(self._rows) - 1)
+            log.info(f"✅ Saved: {new_row['trend'][:50]}... [{new_row['category']}]")
+            return True
+        return False
+
+    def batch_append(self, rows):
+        """Add many rows with one CSV write and one Sheets API call.
+
+        K individual appends cost K spreadsheets.values.append requests;
+        this packs them into a single append_rows call (and a single CSV
+        rewrite). Returns the rows actually stored - duplicates are
+        filtered out up front via the trend index.
+        """
+        new_rows = []
+        seen = set()  # catches duplicates within this batch; the trend
+                      # index only knows rows already stored
+        for data in rows:
+            new_row = self._normalize_row(data)
+            key = new_row['trend'].strip().casefold()
+            if key in seen or self.has_trend(new_row['trend']):
+                log.warning(f"⚠️ Duplicate skipped: {new_row['trend'][:50]}...")
+                continue
+            seen.add(key)
+            new_rows.append(new_row)
+
+        if not new_rows:
+            return []
+
+        csv_success = self._append_rows_to_csv(new_rows)
+        sheets_success = self._append_rows_to_sheets(new_rows)
+
+        if csv_success or sheets_success:
+            for row in new_rows:
+                self._trend_index.add(row['trend'].strip().casefold())
+            self._data_version += 1
+            with self._rows_lock:
+                if self._rows is not None:
+                    start = len(self._rows)
+                    self._rows.extend(new_rows)
+                    for i in range(start, len(self._rows)):
+                        self._index_mirror_row(i)
+            log.info(f"✅ Saved {len(new_rows)} rows in one batch")
+            return new_rows
+        return []
+
+    def _append_rows_to_csv(self, new_rows):
+        """Append many rows to the CSV in a single append-mode write.
+
+        No read-concat-rewrite of the whole file: cost is O(rows added),
+        not O(rows stored). setup_csv guarantees the header exists.
+        """
+        try:
+            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerows([row[k] for k in FIELDS] for row in new_rows)
+            self._note_csv_mtime()
+            return True
+        except Exception as e:
+            log.error(f"❌ Error batch-appending to CSV: {e}")
+            return False
+
+    def _append_rows_to_sheets(self, new_rows):
+        """Append many rows to Google Sheets in a single API call"""
+        if not self.google_sheet:
+            return False
+
+        try:
+            values = [
+                [row['timestamp'], row['trend'], row['category'],
+                 row['instagram_post'], row['blog_draft'],
+                 row['youtube_script'], row['thumbnail_idea'], row['status']]
+                for row in new_rows
+            ]
+            self.google_sheet.append_rows(values, value_input_option='USER_ENTERED')
+            self._index_appended_rows(row['trend'] for row in new_rows)
+            log.info(f"✅ Added {len(values)} rows to Google Sheets")
+            return True
+        except Exception as e:
+            log.error(f"❌ Error batch-appending to Google Sheets: {e}")
+            return False
+
+    def data_version(self):
+        """Monotonic counter identifying the current state of the data.
+
+        Checks for external CSV edits first (one mtime stat), so caches
+        keyed on the version see drift even when nothing else has
+        touched the mirror since the edit.
+        """
+        with self._rows_lock:
+            self._ensure_rows()
+            return self._data_version
+    
+    def _add_to_csv(self, new_row):
+        """Append one row to the CSV file.
+
+        Duplicates are filtered via the trend index in add_row, so this
+        is a single append-mode write - no full-file read and rewrite.
+        """
+        try:
+            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow([new_row[k] for k in FIELDS])
+            self._note_csv_mtime()
+            return True
+
+        except Exception as e:
+            log.error(f"❌ Error adding to CSV: {e}")
+            return False
+    
+    def _add_to_google_sheets(self, new_row):
+        """Add row to Google Sheets"""
+        if not self.google_sheet:
+            return False
+        
+        try:
+            # Append row (duplicates are filtered via the trend index in
+            # add_row - no per-insert column fetch)
+            row_values = [
+                new_row['timestamp'],
+                new_row['trend'],
+                new_row['category'],
+                new_row['instagram_post'],
+                new_row['blog_draft'],
+                new_row['youtube_script'],
+                new_row['thumbnail_idea'],
+                new_row['status']
+            ]
+            
+            self.google_sheet.append_row(row_values)
+            self._index_appended_rows([new_row['trend']])
+            log.info(f"✅ Added to Google Sheets")
+            return True
+            
+        except Exception as e:
+            log.error(f"❌ Error adding to Google Sheets: {e}")
+            return False
+    
+    def get_all_data(self):
+        """Get all stored rows, served from the in-memory mirror.
+
+        Storage is only re-read when the mirror is cold or the CSV's
+        mtime shows it changed underneath us (e.g. an external edit);
+        in-process writes keep the mirror current directly.
+        """
+        with self._rows_lock:
+            if not self._ensure_rows():
+                return []
+            # Shallow copy so callers can't mutate the mirror
+            return list(self._rows)
+
+    def _ensure_rows(self):
+        """Hydrate the mirror if it's cold or the CSV changed on disk.
+
+        Caller must hold _rows_lock. Returns False when loading failed.
+        """
+        try:
+            mtime = os.path.getmtime(self.csv_file) if os.path.exists(self.csv_file) else None
+            if self._rows is None or mtime != self._rows_mtime:
+                reloading = self._rows is not None
+                self._rows = self._load_all_rows()
+                self._rows_mtime = mtime
+                self._rebuild_query_indexes()
+                if reloading:
+                    # External edit detected: bump the version so caches
+                    # keyed on data_version() (the /stats memo) refresh
+                    # too, not just the mirror
+                    self._data_version += 1
+            return True
+        except Exception as e:
+            log.error(f"❌ Error reading data: {e}")
+            return False
+
+    def _rebuild_query_indexes(self):
+        """Recompute the status/category -> row-position indexes"""
+        self._by_status = {}
+        self._by_category = {}
+        for i, row in enumerate(self._rows):
+            self._by_status.setdefault(row.get('status', 'Unknown'), []).append(i)
+            self._by_category.setdefault(row.get('category', 'Unknown'), []).append(i)
+
+    def _index_mirror_row(self, i):
+        """Add one mirror row's position to the inverted indexes"""
+        row = self._rows[i]
+        self._by_status.setdefault(row.get('status', 'Unknown'), []).append(i)
+        self._by_category.setdefault(row.get('category', 'Unknown'), []).append(i)
+
+    def _load_all_rows(self):
+        """Read every row from CSV (primary) or Google Sheets (fallback)"""
+        # Try CSV first
+        if os.path.exists(self.csv_file):
+            df = pd.read_csv(self.csv_file, dtype=_DTYPES, encoding='utf-8')
+            # NaN cleanup in one vectorized pass instead of a Python
+            # loop over every cell
+            return df.fillna('').to_dict('records')
+
+        # Fallback to Google Sheets
+        elif self.google_sheet:
+            return self.google_sheet.get_all_records()
+
+        return []
+
+    def iter_all_data(self):
+        """Yield stored rows without materializing the whole file.
+
+        Reads the CSV in 30k-row chunks, so peak memory stays bounded
+        for consumers (exports, migrations) that only need to stream
+        rows once. Dashboard reads should keep using get_all_data,
+        which serves from the in-memory mirror.
+        """
+        if not os.path.exists(self.csv_file):
+            return
+        for chunk in pd.read_csv(self.csv_file, dtype=_DTYPES,
+                                 encoding='utf-8', chunksize=30000):
+            yield from chunk.fillna('').to_dict('records')
+
+    def _note_csv_mtime(self):
+        """Record the CSV's mtime after our own write, so the next read
+        doesn't mistake it for external drift and re-read the file"""
+        try:
+            self._rows_mtime = os.path.getmtime(self.csv_file)
+        except OSError:
+            self._rows_mtime = None
+    
+    def update_status(self, trend, new_status):
+        """Update approval status in BOTH CSV and Google Sheets"""
+        csv_success = self._update_status_csv(trend, new_status)
+        sheets_success = self._update_status_sheets(trend, new_status)
+
+        if csv_success or sheets_success:
+            self._data_version += 1
+            self._update_mirror_statuses({trend: new_status})
+            return True
+        return False
+
+    def _index_appended_rows(self, trends):
+        """Record sheet row numbers for rows just appended at the end.
+
+        Only possible when the startup column read succeeded - otherwise
+        the running row count is unknown and lookups fall back to a
+        column scan.
+        """
+        if self._sheet_rows is None:
+            return
+        for trend in trends:
+            self._sheet_rows += 1
+            self._row_of[trend] = self._sheet_rows
+
+    def _update_mirror_statuses(self, status_by_trend):
+        """Reflect status changes in the in-memory mirror (if hydrated)"""
+        with self._rows_lock:
+            if self._rows is None:
+                return
+            changed = False
+            for row in self._rows:
+                new_status = status_by_trend.get(row.get('trend'))
+                if new_status is not None and row['status'] != new_status:
+                    row['status'] = new_status
+                    changed = True
+            if changed:
+                self._rebuild_query_indexes()
+    
+    def batch_update_status(self, updates):
+        """Apply many status updates with one CSV write and one API call.
+
+        K update_status calls cost K CSV rewrites and K update_cell
+        requests; this collapses them into a single to_csv plus a single
+        batch_update. Takes {'trend', 'status'} dicts and returns the
+        trends actually updated.
+        """
+        status_by_trend = {str(u['trend']): u['status'] for u in updates}
+        if not status_by_trend:
+            return []
+
+        updated = set()
+
+        # CSV: one read, one vectorized assignment, one write
+        try:
+            # setup_csv guarantees the file exists - no per-call stat
+            df = pd.read_csv(self.csv_file, dtype=_DTYPES, encoding='utf-8')
+            mask = df['trend'].isin(status_by_trend)
+            if mask.any():
+                df.loc[mask, 'status'] = df.loc[mask, 'trend'].map(status_by_trend)
+                df.to_csv(self.csv_file, index=False, encoding='utf-8')
+                self._note_csv_mtime()
+                updated.update(df.loc[mask, 'trend'])
+                log.info(f"✅ Updated {int(mask.sum())} CSV statuses in one write")
+        except Exception as e:
+            log.error(f"❌ Error batch-updating CSV statuses: {e}")
+
+        # Sheets: row numbers come from the trend -> row map (one column
+        # re-read only if some trend isn't indexed), then one
+        # batch_update request for all cells
+        if self.google_sheet:
+            try:
+                if any(t not in self._row_of for t in status_by_trend):
+                    all_trends = self.google_sheet.col_values(2)  # Column B
+                    for i, t in enumerate(all_trends):
+                        if t in status_by_trend:
+                            self._row_of[t] = i + 1
+                cells = [
+                    {'range': f'H{self._row_of[t]}', 'values': [[status]]}
+                    for t, status in status_by_trend.items() if t in self._row_of
+                ]
+                if cells:
+                    self.google_sheet.batch_update(cells, value_input_option='USER_ENTERED')
+                    updated.update(t for t in status_by_trend if t in self._row_of)
+                    log.info(f"✅ Updated {len(cells)} Google Sheets statuses in one call")
+            except Exception as e:
+                log.error(f"❌ Error batch-updating Google Sheets statuses: {e}")
+
+        if updated:
+            self._data_version += 1
+            self._update_mirror_statuses(status_by_trend)
+        return sorted(updated)
+
+    def _update_status_csv(self, trend, new_status):
+        """Update status in CSV"""
+        try:
+            # setup_csv guarantees the file exists - no per-call stat
+            df = pd.read_csv(self.csv_file, dtype=_DTYPES, encoding='utf-8')
+            mask = df['trend'] == trend
+            
+            if not mask.any():
+                return False
+            
+            df.loc[mask, 'status'] = new_status
+            df.to_csv(self.csv_file, index=False, encoding='utf-8')
+            self._note_csv_mtime()
+
+            log.info(f"✅ Updated CSV: {trend[:50]}... → {new_status}")
+            return True
+            
+        except Exception as e:
+            log.error(f"❌ Error updating CSV status: {e}")
+            return False
+    
+    def _update_status_sheets(self, trend, new_status):
+        """Update status in Google Sheets"""
+        if not self.google_sheet:
+            return False
+        
+        try:
+            # O(1) lookup in the trend -> row map; fall back to one
+            # column scan (and remember the result) only when the row
+            # isn't indexed yet
+            row_index = self._row_of.get(trend)
+            if row_index is None:
+                all_trends = self.google_sheet.col_values(2)  # Column B
+
+                if trend not in all_trends:
+                    return False
+
+                row_index = all_trends.index(trend) + 1  # +1 because sheets are 1-indexed
+                self._row_of[trend] = row_index
+
+            # Update status column (Column H = 8)
+            self.google_sheet.update_cell(row_index, 8, new_status)
+            
+            log.info(f"✅ Updated Google Sheet: {trend[:50]}... → {new_status}")
+            return True
+            
+        except Exception as e:
+            log.error(f"❌ Error updating Google Sheets status: {e}")
+            return False
+    
+    def get_by_status(self, status):
+        """Get all trends with specific status (indexed, O(result size))"""
+        with self._rows_lock:
+            if not self._ensure_rows():
+                return []
+            return [self._rows[i] for i in self._by_status.get(status, ())]
+    
+    def get_pending_reviews(self):
+        """Get all trends pending review"""
+        return self.get_by_status('Pending Review')
+    
+    def get_approved_content(self):
+        """Get all approved content (READY FOR PUBLISHING)"""
+        return self.get_by_status('Approved')
+    
+    def get_rejected_content(self):
+        """Get all rejected content"""
+        return self.get_by_status('Rejected')
+    
+    def get_by_category(self, category):
+        """Get all trends in a specific category (indexed, O(result size))"""
+        with self._rows_lock:
+            if not self._ensure_rows():
+                return []
+            return [self._rows[i] for i in self._by_category.get(category, ())]
+    
+    def export_to_json(self, filename='export.json'):
+        """Export data to JSON format"""
+        try:
+            # Rows come from the mirror; save_to_json serializes them
+            # with orjson in C rather than stdlib json
+            data = self.get_all_data()
+            if not save_to_json(data, filename):
+                return False
+
+            log.info(f"✅ Exported {len(data)} records to {filename}")
+            return True
+        except Exception as e:
+            log.error(f"❌ Error exporting to JSON: {e}")
+            return False
+    
+    def get_stats(self):
+        """Get statistics about stored data"""
+        try:
+            all_data = self.get_all_data()
+
+            if not all_data:
+                return {
+                    'total_records': 0,
+                    'by_status': {},
+                    'by_category': {},
+                    'recent_updates': []
+                }
+
+            # Vectorized tallies and a heap-based top-5 instead of a
+            # Python accumulation loop plus a full sort
+            df = pd.DataFrame(all_data)
+            recent = (
+                df.assign(_ts=pd.to_datetime(df['timestamp'], errors='coerce'))
+                  .nlargest(5, '_ts')
+                  .drop(columns='_ts')
+            )
+            return {
+                'total_records': len(df),
+                'by_status': df['status'].value_counts().to_dict(),
+                'by_category': df['category'].value_counts().to_dict(),
+                'recent_updates': recent.to_dict('records')
+            }
+
+        except Exception as e:
+            log.error(f"❌ Error getting stats: {e}")
+            return None
@@ -0,0 +1,8 @@
+"""WSGI entry point for production servers.
+
+Run with a concurrent worker so the long /run-agent workflow doesn't
+block dashboard polls to /stats and /get-trends:
+
+    gunicorn -k gevent -w 1 --threads 8 --timeout 300 wsgi:app
+"""
+from app import app  # noqa: F401